@@ -28,6 +28,7 @@ from typing import Any, Optional
 from dataclasses import dataclass, field
 
 from .hive_config import HiveConfig
+from .models import is_valid_cell_id
 
 
 class CellManagerError(Exception):
@@ -129,7 +130,7 @@ def validate_cell_id(cell_id: str) -> None:
     """
     if not cell_id:
         raise ValidationError("Cell ID cannot be empty")
-    if not VALID_CELL_ID_PATTERN.match(cell_id):
+    if not is_valid_cell_id(cell_id):
         raise ValidationError(
             f"Invalid cell ID: '{cell_id}'. "
             f"Must start with alphanumeric and contain only alphanumeric, hyphen, or underscore. "
@@ -559,7 +560,7 @@ class CellManager:
                 continue
 
             # Skip if directory name doesn't match pattern
-            if not VALID_CELL_ID_PATTERN.match(cell_dir.name):
+            if not is_valid_cell_id(cell_dir.name):
                 continue
 
             config_file = cell_dir / "cell.json"
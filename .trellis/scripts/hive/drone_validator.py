@@ -27,6 +27,12 @@ from typing import Any, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 
+try:
+    from .models import is_valid_cell_id
+except ImportError:
+    # Run directly as a script, with the hive directory on sys.path
+    from models import is_valid_cell_id
+
 
 class DroneValidatorError(Exception):
     """Base exception for drone validator"""
@@ -217,7 +223,7 @@ class DroneValidator:
         """Validate cell ID format"""
         if not cell_id:
             raise ValidationError("Cell ID cannot be empty")
-        if not re.match(r'^[a-zA-Z0-9][a-zA-Z0-9_-]{0,63}$', cell_id):
+        if not is_valid_cell_id(cell_id):
             raise ValidationError(f"Invalid cell ID format: {cell_id}")
     
     def _calculate_consensus(self, results: dict[str, Any]) -> int:
@@ -833,13 +839,22 @@ class DroneValidator:
             result["drone_seed"] = seed
             all_results.append(result)
         
-        # Analyze cross-validation results
-        scores = [r["consensus_score"] for r in all_results]
-        avg_score = sum(scores) / len(scores)
-        
-        # Calculate variance
-        if len(scores) > 1:
-            score_variance = sum((s - avg_score) ** 2 for s in scores) / len(scores)
+        # Analyze cross-validation results in a single pass
+        count = len(all_results)
+        total = 0
+        total_sq = 0
+        all_pass = True
+        for r in all_results:
+            score = r["consensus_score"]
+            total += score
+            total_sq += score * score
+            if not r["consensus_reached"]:
+                all_pass = False
+        avg_score = total / count
+        
+        # Population variance; scores are ints, so the numerator is exact
+        if count > 1:
+            score_variance = (count * total_sq - total * total) / (count * count)
         else:
             score_variance = 0
         
@@ -847,8 +862,6 @@ class DroneValidator:
         # 1. Average score meets threshold
         # 2. Low variance between drones
         # 3. All drones agree on pass/fail
-        all_pass = all(r["consensus_reached"] for r in all_results)
-        any_pass = any(r["consensus_reached"] for r in all_results)
         
         consensus_reached = (
             avg_score >= self.CONSENSUS_THRESHOLD and
@@ -16,12 +16,12 @@ Usage:
 from __future__ import annotations
 
 import logging
-import os
-import re
+import sys
 import warnings
 from enum import Enum
+from operator import attrgetter
 from pathlib import Path
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Any, Optional
 
 # Configure logger
@@ -35,6 +35,13 @@ except ImportError:
     HAS_YAML = False
 
 
+# Shared defaults: every config instance references the same objects
+_DEFAULT_PHEROMONE_FILE = sys.intern(".trellis/pheromone.json")
+_DEFAULT_ISOLATION = sys.intern("strict")
+_DEFAULT_WORKTREE_BASE = sys.intern("../trellis-worktrees")
+_DEFAULT_DRONE_TYPES: tuple[str, ...] = ("technical", "strategic", "security")
+
+
 class ConfigLoadStatus(Enum):
     """Configuration load status"""
     SUCCESS = "success"               # Loaded from file successfully
@@ -61,7 +68,7 @@ class ConfigLoadWarning(UserWarning):
 @dataclass
 class PheromoneConfig:
     """Pheromone communication settings"""
-    file: str = ".trellis/pheromone.json"
+    file: str = _DEFAULT_PHEROMONE_FILE
     timeout: int = 300
     heartbeat_interval: int = 30
 
@@ -87,7 +94,7 @@ class SwarmConfig:
 class DroneConfig:
     """Drone validator settings"""
     ratio: float = 0.4
-    types: list[str] = field(default_factory=lambda: ["technical", "strategic", "security"])
+    types: tuple[str, ...] = _DEFAULT_DRONE_TYPES
     consensus_threshold: int = 90
     max_iterations: int = 5
 
@@ -95,8 +102,8 @@ class DroneConfig:
 @dataclass
 class CellConfig:
     """Cell settings"""
-    isolation: str = "strict"
-    worktree_base: str = "../trellis-worktrees"
+    isolation: str = _DEFAULT_ISOLATION
+    worktree_base: str = _DEFAULT_WORKTREE_BASE
     max_file_size: int = 1024 * 1024  # 1MB
     archive_after_hours: int = 24
 
@@ -130,6 +137,27 @@ class DAGConfig:
     persist_state: bool = True
 
 
+# Key order and getters used by HiveConfig.to_dict()
+_PHEROMONE_KEYS = ("file", "timeout", "heartbeat_interval")
+_WORKER_KEYS = ("min_count", "max_count", "default_count", "timeout", "max_retries")
+_DRONE_KEYS = ("ratio", "types", "consensus_threshold", "max_iterations")
+_CELL_KEYS = ("isolation", "worktree_base", "max_file_size", "archive_after_hours")
+_QUEEN_KEYS = ("heartbeat_interval", "max_concurrent_cells", "timeout_minutes", "auto_decay_monitor")
+_WORKER_POOL_KEYS = (
+    "min_workers", "max_workers", "default_workers",
+    "task_stealing", "worker_timeout", "max_retries",
+)
+_DAG_KEYS = ("enable_cycle_detection", "parallel_layer_limit", "enable_critical_path", "persist_state")
+
+_pheromone_get = attrgetter(*_PHEROMONE_KEYS)
+_worker_get = attrgetter(*_WORKER_KEYS)
+_drone_get = attrgetter(*_DRONE_KEYS)
+_cell_get = attrgetter(*_CELL_KEYS)
+_queen_get = attrgetter(*_QUEEN_KEYS)
+_worker_pool_get = attrgetter(*_WORKER_POOL_KEYS)
+_dag_get = attrgetter(*_DAG_KEYS)
+
+
 @dataclass
 class HiveConfig:
     """Main hive configuration
@@ -301,7 +329,7 @@ class HiveConfig:
         swarm_worker_count = swarm_data.get("worker_count", {})
 
         pheromone = PheromoneConfig(
-            file=pheromone_data.get("file", ".trellis/pheromone.json"),
+            file=pheromone_data.get("file", _DEFAULT_PHEROMONE_FILE),
             timeout=pheromone_data.get("timeout", 300),
             heartbeat_interval=pheromone_data.get("heartbeat_interval", 30)
         )
@@ -319,16 +347,16 @@ class HiveConfig:
 
         drone = DroneConfig(
             ratio=drone_ratio_from_swarm,
-            types=drone_data.get("types", ["technical", "strategic", "security"]),
+            types=tuple(drone_data.get("types", _DEFAULT_DRONE_TYPES)),
             consensus_threshold=drone_data.get("consensus_threshold", 90),
             max_iterations=drone_data.get("max_iterations", 5)
         )
 
         # Get worktree base from worktree.dir if available
-        worktree_base = worktree_data.get("dir", cell_data.get("worktree_base", "../trellis-worktrees"))
+        worktree_base = worktree_data.get("dir", cell_data.get("worktree_base", _DEFAULT_WORKTREE_BASE))
 
         cell = CellConfig(
-            isolation=cell_data.get("isolation", "strict"),
+            isolation=cell_data.get("isolation", _DEFAULT_ISOLATION),
             worktree_base=worktree_base,
             max_file_size=cell_data.get("max_file_size", 1024 * 1024),
             archive_after_hours=cell_data.get("archive_after_hours", 24)
@@ -425,53 +453,18 @@ class HiveConfig:
         Returns:
             Configuration dictionary
         """
+        drone = dict(zip(_DRONE_KEYS, _drone_get(self.drone)))
+        drone["types"] = list(drone["types"])
         return {
             "worker_count": self.worker_count,
             "drone_ratio": self.drone_ratio,
-            "pheromone": {
-                "file": self.pheromone.file,
-                "timeout": self.pheromone.timeout,
-                "heartbeat_interval": self.pheromone.heartbeat_interval
-            },
-            "worker": {
-                "min_count": self.worker.min_count,
-                "max_count": self.worker.max_count,
-                "default_count": self.worker.default_count,
-                "timeout": self.worker.timeout,
-                "max_retries": self.worker.max_retries
-            },
-            "drone": {
-                "ratio": self.drone.ratio,
-                "types": self.drone.types,
-                "consensus_threshold": self.drone.consensus_threshold,
-                "max_iterations": self.drone.max_iterations
-            },
-            "cell": {
-                "isolation": self.cell.isolation,
-                "worktree_base": self.cell.worktree_base,
-                "max_file_size": self.cell.max_file_size,
-                "archive_after_hours": self.cell.archive_after_hours
-            },
-            "queen": {
-                "heartbeat_interval": self.queen.heartbeat_interval,
-                "max_concurrent_cells": self.queen.max_concurrent_cells,
-                "timeout_minutes": self.queen.timeout_minutes,
-                "auto_decay_monitor": self.queen.auto_decay_monitor
-            },
-            "worker_pool": {
-                "min_workers": self.worker_pool.min_workers,
-                "max_workers": self.worker_pool.max_workers,
-                "default_workers": self.worker_pool.default_workers,
-                "task_stealing": self.worker_pool.task_stealing,
-                "worker_timeout": self.worker_pool.worker_timeout,
-                "max_retries": self.worker_pool.max_retries
-            },
-            "dag": {
-                "enable_cycle_detection": self.dag.enable_cycle_detection,
-                "parallel_layer_limit": self.dag.parallel_layer_limit,
-                "enable_critical_path": self.dag.enable_critical_path,
-                "persist_state": self.dag.persist_state
-            }
+            "pheromone": dict(zip(_PHEROMONE_KEYS, _pheromone_get(self.pheromone))),
+            "worker": dict(zip(_WORKER_KEYS, _worker_get(self.worker))),
+            "drone": drone,
+            "cell": dict(zip(_CELL_KEYS, _cell_get(self.cell))),
+            "queen": dict(zip(_QUEEN_KEYS, _queen_get(self.queen))),
+            "worker_pool": dict(zip(_WORKER_POOL_KEYS, _worker_pool_get(self.worker_pool))),
+            "dag": dict(zip(_DAG_KEYS, _dag_get(self.dag))),
         }
 
     def save(self, config_path: Optional[Path] = None) -> None:
@@ -489,7 +482,40 @@ class HiveConfig:
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
         with open(config_path, 'w', encoding='utf-8') as f:
-            yaml.dump(self.to_dict(), f, default_flow_style=False, allow_unicode=True)
+            yaml.dump(self, f, Dumper=_YAML_DUMPER, default_flow_style=False, allow_unicode=True)
+
+
+def _register_yaml_representers(dumper: type) -> None:
+    """Register representers so config dataclasses dump without to_dict()
+
+    Public fields are emitted in sorted order, matching what yaml.dump
+    produced for the to_dict() output.
+
+    Args:
+        dumper: YAML Dumper class to register on
+    """
+    for cls in (
+        PheromoneConfig, WorkerConfig, SwarmConfig, DroneConfig, CellConfig,
+        QueenConfig, WorkerPoolConfig, DAGConfig, HiveConfig,
+    ):
+        names = tuple(sorted(f.name for f in fields(cls) if not f.name.startswith("_")))
+
+        def represent(d, obj, names=names):
+            return d.represent_mapping(
+                "tag:yaml.org,2002:map",
+                [(name, getattr(obj, name)) for name in names]
+            )
+
+        dumper.add_representer(cls, represent)
+
+
+if HAS_YAML:
+    class _ConfigDumper(getattr(yaml, "CSafeDumper", yaml.SafeDumper)):
+        """Safe dumper private to config saving, so the representers below
+        do not leak into other yaml.dump() callers"""
+
+    _YAML_DUMPER = _ConfigDumper
+    _register_yaml_representers(_YAML_DUMPER)
 
 
 # Global config instance (lazy loaded)
@@ -524,7 +550,6 @@ def reset_config() -> None:
 def main():
     """CLI entry point"""
     import argparse
-    import json
 
     parser = argparse.ArgumentParser(description="Hive configuration tool")
     subparsers = parser.add_subparsers(dest="command", help="Subcommands")
@@ -539,7 +564,12 @@ def main():
 
     if args.command == "show":
         config = get_config()
-        print(json.dumps(config.to_dict(), indent=2, ensure_ascii=False))
+        try:
+            import orjson
+            print(orjson.dumps(config.to_dict(), option=orjson.OPT_INDENT_2).decode())
+        except ImportError:
+            import json
+            print(json.dumps(config.to_dict(), indent=2, ensure_ascii=False))
 
     elif args.command == "validate":
         try:
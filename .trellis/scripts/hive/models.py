@@ -11,13 +11,75 @@ Usage:
     from hive.models import Worker, WorkerState, WorkerTask, TaskPriority
 """
 
-from __future__ import annotations
-
-import subprocess
+import string
+import sys
+import time
 from datetime import datetime, timezone
 from dataclasses import dataclass, field
-from enum import Enum
-from typing import Optional
+from enum import Enum, IntEnum
+from functools import lru_cache
+from operator import attrgetter
+from typing import Final, Iterable, Optional, Sequence
+
+# orjson is optional dependency (fast JSON encoding)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    import json
+    HAS_ORJSON = False
+
+# msgspec is optional dependency (msgpack serialization)
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+
+_UTC = timezone.utc
+
+# Shared empty default for task inputs/outputs; replaced by a list on first add
+_EMPTY: tuple[str, ...] = ()
+
+# Allowed cell ID characters: ^[a-zA-Z0-9][a-zA-Z0-9_-]{0,63}$
+_CELL_ID_FIRST_CHARS = frozenset(string.ascii_letters + string.digits)
+_CELL_ID_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+
+
+def ns_to_iso(ns: Optional[int]) -> Optional[str]:
+    """Format a nanosecond epoch timestamp as a UTC ISO string.
+
+    Args:
+        ns: Nanoseconds since the epoch, or None
+
+    Returns:
+        ISO 8601 string, or None if ns is None
+    """
+    if ns is None:
+        return None
+    return datetime.fromtimestamp(ns / 1e9, _UTC).isoformat()
+
+
+@lru_cache(maxsize=256)
+def is_valid_cell_id(cell_id: str) -> bool:
+    """Check a cell ID is 1-64 alphanumeric, "_" or "-" characters.
+
+    The first character must be alphanumeric. Unlike re.match() with a
+    trailing "$", a trailing newline is rejected. Results are memoized
+    per ID.
+
+    Args:
+        cell_id: Cell ID to check
+
+    Returns:
+        True if the ID is valid
+    """
+    return (
+        0 < len(cell_id) <= 64
+        and cell_id[0] in _CELL_ID_FIRST_CHARS
+        and _CELL_ID_CHARS.issuperset(cell_id)
+    )
 
 
 class HiveError(Exception):
@@ -29,6 +91,22 @@ class HiveError(Exception):
     pass
 
 
+class WorkerUnavailableError(HiveError):
+    """Raised when assigning a task to a worker that cannot accept one.
+    
+    The message is formatted lazily in __str__, so raising it on a busy
+    scheduling path allocates no string unless the error is displayed.
+    """
+    
+    def __init__(self, worker_id: str, state: "WorkerState"):
+        super().__init__(worker_id, state)
+        self.worker_id = worker_id
+        self.state = state
+    
+    def __str__(self) -> str:
+        return f"Worker {self.worker_id} is not available (state: {_STATE_VALUE[self.state]})"
+
+
 class WorkerState(Enum):
     """Worker lifecycle states.
     
@@ -48,7 +126,7 @@ class WorkerState(Enum):
     STOPPED = "stopped"
 
 
-class TaskPriority(Enum):
+class TaskPriority(IntEnum):
     """Task priority levels for scheduling.
     
     Higher priority tasks are scheduled first when multiple
@@ -59,7 +137,33 @@ class TaskPriority(Enum):
     LOW = 3
 
 
-@dataclass
+# Serialized enum values, resolved once at import time
+_STATE_VALUE = {s: sys.intern(s.value) for s in WorkerState}
+_PRIORITY_VALUE = {p: p.value for p in TaskPriority}
+
+# Module-level state constants for hot-path identity checks
+_IDLE: Final = WorkerState.IDLE
+_BUSY: Final = WorkerState.BUSY
+_ERROR: Final = WorkerState.ERROR
+_TIMEOUT: Final = WorkerState.TIMEOUT
+
+# States from which a worker may accept a new task
+_AVAILABLE_STATES: Final = frozenset({_IDLE, _ERROR, _TIMEOUT})
+
+# Worker state machine: (current state, event) -> next state.
+# "assign" is only valid from an available state; a task can be completed
+# ("ok") or failed ("fail") from any state.
+_TRANSITIONS: Final[dict[tuple[WorkerState, str], WorkerState]] = {
+    **{(s, "assign"): _BUSY for s in _AVAILABLE_STATES},
+    **{(s, "ok"): _IDLE for s in WorkerState},
+    **{(s, "fail"): _ERROR for s in WorkerState},
+}
+
+# Counter incremented for each completion event
+_COUNTER_BUMP: Final = {"ok": "completed_tasks", "fail": "failed_tasks"}
+
+
+@dataclass(slots=True, eq=False)
 class WorkerTask:
     """Task definition for worker execution.
     
@@ -76,7 +180,7 @@ class WorkerTask:
         timeout: Maximum execution time in seconds
         inputs: List of input file paths or data references
         outputs: List of expected output file paths
-        created_at: ISO timestamp of task creation
+        created_at: Task creation time (ns since epoch)
     """
     cell_id: str
     description: str = ""
@@ -84,12 +188,51 @@ class WorkerTask:
     worktree_path: Optional[str] = None
     platform: str = "claude"
     timeout: int = 300
-    inputs: list[str] = field(default_factory=list)
-    outputs: list[str] = field(default_factory=list)
-    created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    inputs: Sequence[str] = _EMPTY
+    outputs: Sequence[str] = _EMPTY
+    created_at: int = field(default_factory=time.time_ns)
+    
+    def __lt__(self, other: "WorkerTask") -> bool:
+        """Order by priority, then creation time (FIFO within a priority).
+        
+        Lets tasks go straight into a heapq without a tuple wrapper.
+        Equality and hashing are by identity.
+        """
+        return (self.priority, self.created_at) < (other.priority, other.created_at)
+    
+    def add_input(self, path: str) -> None:
+        """Append an input reference, copying the shared empty default on first write."""
+        if isinstance(self.inputs, list):
+            self.inputs.append(path)
+        else:
+            self.inputs = [*self.inputs, path]
+    
+    def add_output(self, path: str) -> None:
+        """Append an expected output, copying the shared empty default on first write."""
+        if isinstance(self.outputs, list):
+            self.outputs.append(path)
+        else:
+            self.outputs = [*self.outputs, path]
+    
+    def to_dict(self) -> dict:
+        """Convert task to dictionary representation.
+        
+        Priority is emitted as its int value and created_at as an ISO string.
+        """
+        return {
+            "cell_id": self.cell_id,
+            "description": self.description,
+            "priority": _PRIORITY_VALUE[self.priority],
+            "worktree_path": self.worktree_path,
+            "platform": self.platform,
+            "timeout": self.timeout,
+            "inputs": list(self.inputs),
+            "outputs": list(self.outputs),
+            "created_at": ns_to_iso(self.created_at),
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class Worker:
     """Worker representation in the hive.
     
@@ -103,11 +246,10 @@ class Worker:
         cell_id: ID of cell being processed (for backward compatibility)
         current_task: Currently assigned task, if any
         progress: Task progress percentage (0-100)
-        started_at: ISO timestamp when worker started
-        last_heartbeat: ISO timestamp of last heartbeat
+        started_at: Time the current task started (ns since epoch)
+        last_heartbeat: Time of last heartbeat (ns since epoch)
         completed_tasks: Number of successfully completed tasks
         failed_tasks: Number of failed tasks
-        process: Subprocess handle for the worker process
         worktree_path: Path to the worker's isolated worktree
     """
     id: str
@@ -115,31 +257,76 @@ class Worker:
     cell_id: Optional[str] = None
     current_task: Optional[WorkerTask] = None
     progress: int = 0
-    started_at: Optional[str] = None
-    last_heartbeat: Optional[str] = None
+    started_at: Optional[int] = None
+    last_heartbeat: Optional[int] = None
     completed_tasks: int = 0
     failed_tasks: int = 0
-    process: Optional[subprocess.Popen] = None
     worktree_path: Optional[str] = None
+    _dict_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _dict_cache: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    # (last_heartbeat, monotonic ns) recorded together by update_heartbeat()
+    _heartbeat_mark: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
     
     def update_heartbeat(self) -> None:
         """Update heartbeat timestamp to current time."""
-        self.last_heartbeat = datetime.now(timezone.utc).isoformat()
+        ts = time.time_ns()
+        self.last_heartbeat = ts
+        self._heartbeat_mark = (ts, time.monotonic_ns())
+    
+    def heartbeat_age(self, now_mono: Optional[int] = None, now_ns: Optional[int] = None) -> Optional[float]:
+        """Get seconds elapsed since the last heartbeat.
+        
+        Measured on the monotonic clock when the heartbeat was recorded by
+        this class, so wall-clock adjustments cannot fake a timeout. A
+        heartbeat assigned directly (no monotonic stamp) falls back to the
+        wall-clock timestamp.
+        
+        Args:
+            now_mono: Current time.monotonic_ns(), shared across a scan
+            now_ns: Current time.time_ns(), shared across a scan
+        
+        Returns:
+            Elapsed seconds, or None if there has been no heartbeat
+        """
+        last = self.last_heartbeat
+        if not last:
+            return None
+        mark = self._heartbeat_mark
+        if mark is not None and mark[0] == last:
+            if now_mono is None:
+                now_mono = time.monotonic_ns()
+            return (now_mono - mark[1]) / 1e9
+        if now_ns is None:
+            now_ns = time.time_ns()
+        return (now_ns - last) / 1e9
+    
+    @classmethod
+    def tick_all(cls, workers: Iterable["Worker"]) -> None:
+        """Update heartbeats of several workers with one shared timestamp.
+        
+        Args:
+            workers: Workers to update
+        """
+        ts = time.time_ns()
+        mark = (ts, time.monotonic_ns())
+        for w in workers:
+            w.last_heartbeat = ts
+            w._heartbeat_mark = mark
     
     def is_idle(self) -> bool:
         """Check if worker is idle and available for new tasks."""
-        return self.state == WorkerState.IDLE
+        return self.state is _IDLE
     
     def is_busy(self) -> bool:
         """Check if worker is currently executing a task."""
-        return self.state == WorkerState.BUSY
+        return self.state is _BUSY
     
     def is_available(self) -> bool:
         """Check if worker is available for new task assignment.
         
         Workers in IDLE, ERROR, or TIMEOUT states can accept new tasks.
         """
-        return self.state in (WorkerState.IDLE, WorkerState.ERROR, WorkerState.TIMEOUT)
+        return self.state in _AVAILABLE_STATES
     
     def assign_task(self, task: WorkerTask) -> None:
         """Assign a new task to this worker.
@@ -148,17 +335,19 @@ class Worker:
             task: The task to assign
             
         Raises:
-            HiveError: If worker is not available for new tasks
+            WorkerUnavailableError: If worker is not available for new tasks
         """
-        if not self.is_available():
-            raise HiveError(f"Worker {self.id} is not available (state: {self.state.value})")
+        # Inlined is_available(): identity checks against enum singletons
+        state = self.state
+        if state is not _IDLE and state is not _ERROR and state is not _TIMEOUT:
+            raise WorkerUnavailableError(self.id, state)
         
         self.current_task = task
         self.cell_id = task.cell_id
-        self.state = WorkerState.BUSY
+        self.state = _TRANSITIONS[(state, "assign")]
         self.progress = 0
-        self.started_at = datetime.now(timezone.utc).isoformat()
         self.update_heartbeat()
+        self.started_at = self.last_heartbeat
     
     def complete_task(self, success: bool = True) -> None:
         """Mark current task as completed.
@@ -166,12 +355,10 @@ class Worker:
         Args:
             success: Whether the task completed successfully
         """
-        if success:
-            self.completed_tasks += 1
-            self.state = WorkerState.IDLE
-        else:
-            self.failed_tasks += 1
-            self.state = WorkerState.ERROR
+        event = "ok" if success else "fail"
+        counter = _COUNTER_BUMP[event]
+        setattr(self, counter, getattr(self, counter) + 1)
+        self.state = _TRANSITIONS[(self.state, event)]
         
         self.current_task = None
         self.cell_id = None
@@ -180,27 +367,118 @@ class Worker:
     def to_dict(self) -> dict:
         """Convert worker to dictionary representation.
         
-        Note: process handle is excluded as it's not serializable.
+        Timestamps are emitted as ISO strings. Fields are often assigned
+        directly by schedulers, so instead of a dirty flag the result is
+        cached against a snapshot of the field values and reused while the
+        snapshot is unchanged. Workers with a task are not cached, since the
+        task itself may change without the snapshot changing.
         """
-        return {
-            "id": self.id,
-            "state": self.state.value,
-            "cell_id": self.cell_id,
-            "current_task": self.current_task.__dict__ if self.current_task else None,
-            "progress": self.progress,
-            "started_at": self.started_at,
-            "last_heartbeat": self.last_heartbeat,
-            "completed_tasks": self.completed_tasks,
-            "failed_tasks": self.failed_tasks,
-            "worktree_path": self.worktree_path,
-        }
+        vals = _worker_get(self)
+        if vals == self._dict_key:
+            return self._dict_cache.copy()
+        
+        d = dict(zip(_WORKER_FIELDS, vals))
+        d["state"] = _STATE_VALUE[d["state"]]
+        task = d["current_task"]
+        d["current_task"] = task.to_dict() if task else None
+        d["started_at"] = ns_to_iso(d["started_at"])
+        d["last_heartbeat"] = ns_to_iso(d["last_heartbeat"])
+        
+        if task is None:
+            self._dict_key = vals
+            self._dict_cache = d.copy()
+        return d
+    
+    def to_json(self) -> bytes:
+        """Encode worker as UTF-8 JSON bytes.
+        
+        Uses orjson when installed, stdlib json otherwise.
+        """
+        if HAS_ORJSON:
+            return orjson.dumps(self.to_dict())
+        return json.dumps(self.to_dict(), ensure_ascii=False).encode("utf-8")
+    
+    def to_msgpack(self) -> bytes:
+        """Encode worker as msgpack via precompiled msgspec structs.
+        
+        Timestamps are kept as ns-since-epoch ints.
+        
+        Raises:
+            HiveError: If msgspec is not installed
+        """
+        if not HAS_MSGSPEC:
+            raise HiveError("msgspec required for msgpack serialization")
+        
+        task = self.current_task
+        return _WORKER_ENCODER.encode(WorkerStruct(
+            id=self.id,
+            state=_STATE_VALUE[self.state],
+            cell_id=self.cell_id,
+            current_task=WorkerTaskStruct(
+                cell_id=task.cell_id,
+                description=task.description,
+                priority=_PRIORITY_VALUE[task.priority],
+                worktree_path=task.worktree_path,
+                platform=task.platform,
+                timeout=task.timeout,
+                inputs=list(task.inputs),
+                outputs=list(task.outputs),
+                created_at=task.created_at,
+            ) if task else None,
+            progress=self.progress,
+            started_at=self.started_at,
+            last_heartbeat=self.last_heartbeat,
+            completed_tasks=self.completed_tasks,
+            failed_tasks=self.failed_tasks,
+            worktree_path=self.worktree_path,
+        ))
+
+
+# Serialized Worker fields, in output order
+_WORKER_FIELDS = (
+    "id", "state", "cell_id", "current_task", "progress", "started_at",
+    "last_heartbeat", "completed_tasks", "failed_tasks", "worktree_path",
+)
+_worker_get = attrgetter(*_WORKER_FIELDS)
+
+
+if HAS_MSGSPEC:
+    class WorkerTaskStruct(msgspec.Struct, gc=False):
+        """msgspec mirror of WorkerTask used for msgpack encoding."""
+        cell_id: str
+        description: str = ""
+        priority: int = TaskPriority.MEDIUM.value
+        worktree_path: Optional[str] = None
+        platform: str = "claude"
+        timeout: int = 300
+        inputs: list[str] = []
+        outputs: list[str] = []
+        created_at: int = 0
+
+    class WorkerStruct(msgspec.Struct, gc=False):
+        """msgspec mirror of Worker used for msgpack encoding."""
+        id: str
+        state: str = WorkerState.IDLE.value
+        cell_id: Optional[str] = None
+        current_task: Optional[WorkerTaskStruct] = None
+        progress: int = 0
+        started_at: Optional[int] = None
+        last_heartbeat: Optional[int] = None
+        completed_tasks: int = 0
+        failed_tasks: int = 0
+        worktree_path: Optional[str] = None
+
+    _WORKER_ENCODER = msgspec.msgpack.Encoder()
 
 
 # Re-export for convenience
 __all__ = [
     "HiveError",
+    "WorkerUnavailableError",
     "WorkerState",
     "TaskPriority", 
     "WorkerTask",
     "Worker",
+    "ns_to_iso",
+    "is_valid_cell_id",
 ]
@@ -8,15 +8,48 @@ Manages pheromone-based state synchronization for concurrent agents.
 
 from __future__ import annotations
 
+import calendar
+import errno
 import json
+import mmap
 import os
+import queue
+import random
+import socket
 import sys
 import threading
 import time
-from dataclasses import dataclass
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional, Dict, List
+from typing import Any, Iterator, Optional, Dict, List
+
+# orjson is optional dependency (faster pheromone file encode/decode)
+try:
+    import orjson
+    HAS_ORJSON = True
+
+    def _dumps(data: Dict[str, Any]) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+    def _dumps_line(data: Dict[str, Any]) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+
+    _loads = orjson.loads
+except ImportError:
+    HAS_ORJSON = False
+
+    def _dumps(data: Dict[str, Any]) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+    def _dumps_line(data: Dict[str, Any]) -> bytes:
+        return (json.dumps(data, ensure_ascii=False) + "\n").encode("utf-8")
+
+    _loads = json.loads
 
 # Cross-platform file locking
 HAS_FCNTL = False
@@ -35,11 +68,169 @@ except ImportError:
 
 # Lock status constants
 LOCK_STALE_THRESHOLD = 300  # Seconds after which a lock is considered stale
+LOCK_BACKOFF_INITIAL = 0.001  # First retry delay in seconds
+LOCK_BACKOFF_MAX = 0.05  # Upper bound on the retry delay in seconds
+LOCK_STALE_CHECK_INTERVAL = 8  # Retries between stale lock checks
+LOCK_INFO_MAX_SIZE = 512  # Fixed size of the space-padded lock holder record
+LOCK_INFO_CACHE_TTL = 0.05  # Seconds a polled lock holder read is reused
+_LOCK_BUSY_ERRNOS = frozenset((errno.EAGAIN, errno.EWOULDBLOCK))  # "Lock is busy" errors
+
+# Pheromone files at least this large are parsed straight from a memory map
+# (orjson only; the json fallback needs bytes anyway)
+MMAP_READ_THRESHOLD = 1024 * 1024
+
+# Strength changes smaller than this are not worth rewriting the file for
+DECAY_STRENGTH_EPSILON = 1e-3
+DECAY_MIN_INTERVAL = 1.0  # Shortest wait between decay passes in seconds
+DECAY_IDLE_BACKOFF_MAX = 10  # Idle decay waits grow up to this many intervals
+
+# Written into every lock file; looked up once rather than per acquire
+_HOSTNAME = socket.gethostname()
+_PID = os.getpid()
+
+
+def _refresh_pid() -> None:
+    """Update the cached PID in a forked child"""
+    global _PID
+    _PID = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_refresh_pid)
+# Lock file content with the hostname pre-encoded; format with (pid, time)
+_LOCK_INFO_TEMPLATE = b"%d:%r:" + _HOSTNAME.encode('utf-8').replace(b"%", b"%%")
+
+
+# Directories this process has already created or found, so hot paths skip
+# the mkdir call; an entry is dropped again if the directory goes missing
+_ensured_dirs: set = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a directory (and parents) once per process
+
+    Args:
+        path: Directory path
+    """
+    if path not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+
+
+# Date and time part of the last formatted timestamp, as (epoch second,
+# "YYYY-MM-DDTHH:MM:SS."); calls within the same second only add microseconds
+_iso_second: tuple[int, str] = (-1, "")
+
+
+def _utc_now_iso(now_ns: Optional[int] = None) -> str:
+    """Format the current UTC time like datetime.isoformat()
+
+    Equivalent to datetime.now(timezone.utc).isoformat() except that the
+    microseconds are always present, without building datetime objects.
+
+    Args:
+        now_ns: Epoch time in nanoseconds to format (None = now)
+
+    Returns:
+        Timestamp such as "2025-01-01T12:00:00.000000+00:00"
+    """
+    global _iso_second
+    if now_ns is None:
+        now_ns = time.time_ns()
+    sec, ns = divmod(now_ns, 1_000_000_000)
+    cached_sec, prefix = _iso_second
+    if sec != cached_sec:
+        gm = time.gmtime(sec)
+        prefix = (
+            f"{gm.tm_year:04d}-{gm.tm_mon:02d}-{gm.tm_mday:02d}T"
+            f"{gm.tm_hour:02d}:{gm.tm_min:02d}:{gm.tm_sec:02d}."
+        )
+        _iso_second = (sec, prefix)
+    return f"{prefix}{ns // 1000:06d}+00:00"
+
+
+def _iso_to_epoch(ts: str) -> float:
+    """Convert an ISO timestamp to epoch seconds
+
+    Timestamps in the fixed _utc_now_iso() layout are parsed by slicing;
+    anything else (no microseconds, "Z" suffix, other offsets) falls back
+    to datetime.fromisoformat.
+
+    Args:
+        ts: ISO 8601 timestamp
+
+    Returns:
+        Seconds since the epoch
+
+    Raises:
+        ValueError: If the timestamp cannot be parsed or has no offset
+        TypeError: If ts is not a string
+    """
+    if len(ts) == 32 and ts[19] == "." and ts.endswith("+00:00"):
+        return calendar.timegm((
+            int(ts[0:4]), int(ts[5:7]), int(ts[8:10]),
+            int(ts[11:13]), int(ts[14:16]), int(ts[17:19]), 0, 0, 0
+        )) + int(ts[20:26]) * 1e-6
+
+    if ts.endswith('Z'):
+        ts = ts[:-1] + '+00:00'
+    dt = datetime.fromisoformat(ts)
+    if dt.tzinfo is None:
+        raise ValueError(f"Timestamp has no UTC offset: {ts}")
+    return dt.timestamp()
+
+
+def _copy_pheromone(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy pheromone data deep enough for callers to mutate it
+
+    Copies the top-level dict, its lists and dicts, and every record dict
+    inside those lists (workers, active pheromones, blockers). Values
+    nested below a record (e.g. a pheromone's "data") are shared.
+
+    Args:
+        data: Pheromone data dictionary
+
+    Returns:
+        Copied pheromone data
+    """
+    out = {}
+    for key, value in data.items():
+        if type(value) is list:
+            value = [item.copy() if type(item) is dict else item for item in value]
+        elif type(value) is dict:
+            value = value.copy()
+        out[key] = value
+    return out
+
+
+def _index_workers(data: Dict[str, Any]) -> Dict[str, int]:
+    """Map worker ID to its position in data["workers"]
+
+    Positions stay valid for copies made by _copy_pheromone, so one index
+    built per parse serves every read of that parse.
+
+    Args:
+        data: Pheromone data dictionary
+
+    Returns:
+        Dictionary of worker ID to list index
+    """
+    workers = data.get("workers")
+    if type(workers) is not list:
+        return {}
+    index: Dict[str, int] = {}
+    for i, w in enumerate(workers):
+        if type(w) is dict:
+            # First entry wins, matching a front-to-back scan
+            index.setdefault(w.get("id"), i)
+    return index
 
 
 class LockInfo:
     """Lock information for diagnostics"""
     
+    __slots__ = ("holder_pid", "holder_time", "holder_hostname")
+    
     def __init__(
         self,
         holder_pid: Optional[int] = None,
@@ -60,30 +251,34 @@ class LockInfo:
         Returns:
             LockInfo or None if file doesn't exist
         """
-        if not lock_file.exists():
+        try:
+            fd = os.open(lock_file, os.O_RDONLY)
+        except OSError:
             return None
-        
         try:
-            with open(lock_file, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-            
-            parts = content.split(':')
-            if len(parts) >= 2:
+            content = os.read(fd, LOCK_INFO_MAX_SIZE)
+        except OSError:
+            return None
+        finally:
+            os.close(fd)
+        
+        parts = content.decode('utf-8', 'replace').strip().split(':', 2)
+        if len(parts) >= 2:
+            try:
                 return cls(
                     holder_pid=int(parts[0]),
                     holder_time=float(parts[1]),
                     holder_hostname=parts[2] if len(parts) > 2 else None
                 )
-        except (ValueError, IOError, OSError):
-            pass
+            except ValueError:
+                pass
         
         return None
     
     def to_string(self) -> str:
         """Convert to string for file storage"""
-        import socket
-        hostname = self.holder_hostname or socket.gethostname()
-        return f"{self.holder_pid or os.getpid()}:{self.holder_time or time.time()}:{hostname}"
+        hostname = self.holder_hostname or _HOSTNAME
+        return f"{self.holder_pid or _PID}:{self.holder_time or time.time()}:{hostname}"
     
     def is_stale(self, threshold: float = LOCK_STALE_THRESHOLD) -> bool:
         """Check if lock is stale
@@ -108,8 +303,16 @@ class FileLock:
     - Lock stale detection and automatic cleanup
     - Lock holder information tracking
     - Timeout support with configurable wait
+    
+    Threads of one process first queue on an in-process lock per lock file,
+    so only one of them at a time polls the OS lock and the rest wake as
+    soon as it is released.
     """
     
+    # In-process lock per lock file path, shared by all FileLock instances
+    _local_locks: dict[Path, threading.Lock] = {}
+    _local_locks_guard = threading.Lock()
+    
     def __init__(self, lock_file: Path, stale_threshold: float = LOCK_STALE_THRESHOLD):
         """Initialize file lock
         
@@ -123,6 +326,12 @@ class FileLock:
         self._lock_handle: Optional[Any] = None
         self._owned = False
         self._acquire_time: Optional[float] = None
+        # time.time() the holder record was last written by this lock
+        self._info_time: Optional[float] = None
+        self._local_lock: Optional[threading.Lock] = None
+        # (monotonic time, info) of the last lock file read by is_locked()
+        # or get_lock_info()
+        self._info_cache: Optional[tuple[float, Optional[LockInfo]]] = None
 
     def acquire(self, timeout: float = 10.0) -> bool:
         """Acquire lock with timeout
@@ -133,14 +342,54 @@ class FileLock:
         Returns:
             True if lock acquired, False if timeout
         """
-        start_time = time.time()
-        self.lock_file.parent.mkdir(parents=True, exist_ok=True)
+        deadline = time.monotonic() + timeout
         
-        while time.time() - start_time < timeout:
+        local_lock = self._get_local_lock()
+        if not local_lock.acquire(timeout=max(timeout, 0)):
+            return False
+        try:
+            if self._acquire_os_lock(deadline):
+                self._local_lock = local_lock
+                return True
+        except BaseException:
+            local_lock.release()
+            raise
+        local_lock.release()
+        return False
+    
+    def _get_local_lock(self) -> threading.Lock:
+        """Get the in-process lock for this lock file
+        
+        Returns:
+            Lock shared by every FileLock on the same path
+        """
+        local_lock = self._local_locks.get(self.lock_file)
+        if local_lock is None:
+            with self._local_locks_guard:
+                local_lock = self._local_locks.setdefault(self.lock_file, threading.Lock())
+        return local_lock
+    
+    @classmethod
+    def _reset_local_locks(cls) -> None:
+        """Drop in-process locks inherited by a forked child"""
+        cls._local_locks = {}
+        cls._local_locks_guard = threading.Lock()
+    
+    def _acquire_os_lock(self, deadline: float) -> bool:
+        """Acquire the OS-level lock, retrying until the deadline
+        
+        Args:
+            deadline: time.monotonic() value after which to give up
+            
+        Returns:
+            True if lock acquired, False if timeout
+        """
+        _ensure_dir(self.lock_file.parent)
+        
+        backoff = LOCK_BACKOFF_INITIAL
+        attempt = 0
+        while True:
             try:
-                # Check for stale locks before attempting
-                self._cleanup_stale_lock()
-                
                 if HAS_FCNTL:
                     # Unix-like system - use fcntl for robust locking
                     if self._acquire_fcntl():
@@ -156,15 +405,31 @@ class FileLock:
                     if self._acquire_atomic():
                         return True
                 
-                # Wait before retry
-                time.sleep(0.1)
-                
-            except (IOError, OSError) as e:
-                # Log error and retry
-                if 'resource temporarily unavailable' not in str(e).lower():
+            except FileNotFoundError:
+                # Lock directory was removed since it was created; recreate it
+                self._close_lock_resources()
+                _ensured_dirs.discard(self.lock_file.parent)
+                _ensure_dir(self.lock_file.parent)
+            except OSError as e:
+                # Log error and retry; EAGAIN just means the lock is busy
+                if e.errno not in _LOCK_BUSY_ERRNOS:
                     print(f"Lock acquisition error: {e}", file=sys.stderr)
                 self._close_lock_resources()
-                time.sleep(0.1)
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            
+            # Look for a stale holder only after an attempt has failed, and
+            # then periodically rather than on every retry
+            if attempt % LOCK_STALE_CHECK_INTERVAL == 0:
+                self._cleanup_stale_lock()
+            
+            # Exponential backoff with jitter so waiting agents do not retry
+            # in lockstep
+            attempt += 1
+            time.sleep(min(backoff + random.random() * backoff, remaining))
+            backoff = min(backoff * 2, LOCK_BACKOFF_MAX)
         
         return False
 
@@ -239,35 +504,74 @@ class FileLock:
 
     def _write_lock_info(self) -> None:
         """Write lock holder information"""
-        info = LockInfo(
-            holder_pid=os.getpid(),
-            holder_time=time.time()
-        )
+        # Same "pid:time:hostname" layout as LockInfo.to_string(), padded to
+        # a fixed size so it fully overwrites the previous holder's record
+        now = time.time()
+        content = (_LOCK_INFO_TEMPLATE % (_PID, now)).ljust(LOCK_INFO_MAX_SIZE)
+        self._info_time = now
         
         try:
             if self._lock_fd is not None:
-                # Write to file descriptor
-                os.write(self._lock_fd, info.to_string().encode('utf-8'))
+                # Write to file descriptor, from the start on a refresh
+                os.lseek(self._lock_fd, 0, os.SEEK_SET)
+                os.write(self._lock_fd, content)
             elif self._lock_handle is not None:
                 # Write to file handle
                 self._lock_handle.seek(0)
                 self._lock_handle.truncate()
-                self._lock_handle.write(info.to_string())
+                self._lock_handle.write(content.decode('utf-8'))
                 self._lock_handle.flush()
         except (IOError, OSError):
             pass  # Non-critical, continue
 
+    def refresh(self) -> None:
+        """Rewrite the holder record during a long hold
+        
+        Keeps other processes from taking a lock held longer than the
+        stale threshold for an abandoned one. The record is only rewritten
+        once it is a quarter of the threshold old, so this is cheap to call
+        on every use of a held lock.
+        """
+        if not self._owned:
+            return
+        written = self._info_time
+        if written is not None and time.time() - written < self.stale_threshold / 4:
+            return
+        self._write_lock_info()
+    
     def _cleanup_stale_lock(self) -> None:
-        """Clean up stale locks if found"""
+        """Clean up stale locks if found
+        
+        With fcntl a stale-looking record may still belong to a live, long
+        hold, so the file is only unlinked after a non-blocking flock probe
+        shows that nobody holds it.
+        """
         info = LockInfo.from_file(self.lock_file)
+        if not (info and info.is_stale(self.stale_threshold)):
+            return
         
-        if info and info.is_stale(self.stale_threshold):
-            # Lock is stale, attempt cleanup
+        probe_fd = None
+        if HAS_FCNTL:
             try:
-                self.lock_file.unlink()
-                print(f"Cleaned up stale lock: {self.lock_file}", file=sys.stderr)
-            except (IOError, OSError):
-                pass
+                probe_fd = os.open(str(self.lock_file), os.O_RDWR)
+            except OSError:
+                return
+            try:
+                fcntl.flock(probe_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                # Still held; the holder just has not refreshed its record
+                os.close(probe_fd)
+                return
+        
+        # Lock is stale, attempt cleanup
+        try:
+            self.lock_file.unlink()
+            print(f"Cleaned up stale lock: {self.lock_file}", file=sys.stderr)
+        except (IOError, OSError):
+            pass
+        finally:
+            if probe_fd is not None:
+                os.close(probe_fd)
 
     def _close_lock_resources(self) -> None:
         """Close any open lock resources"""
@@ -308,14 +612,22 @@ class FileLock:
             self._close_lock_resources()
             self._owned = False
             self._acquire_time = None
+            self._info_time = None
+            self._info_cache = None
             
             # Clean up lock file for atomic mode
             if not (HAS_FCNTL or HAS_MSVCRT):
                 try:
-                    if self.lock_file.exists():
-                        self.lock_file.unlink()
-                except (IOError, OSError):
+                    os.unlink(self.lock_file)
+                except OSError:
                     pass
+            
+            # Let the next thread of this process in only once the OS lock
+            # is free for it
+            local_lock = self._local_lock
+            if local_lock is not None:
+                self._local_lock = None
+                local_lock.release()
 
     def is_locked(self) -> bool:
         """Check if lock is currently held by anyone
@@ -326,7 +638,7 @@ class FileLock:
         if self._owned:
             return True
             
-        info = LockInfo.from_file(self.lock_file)
+        info = self._read_lock_info()
         if info and not info.is_stale(self.stale_threshold):
             return True
             
@@ -340,10 +652,24 @@ class FileLock:
         """
         if self._owned:
             return LockInfo(
-                holder_pid=os.getpid(),
+                holder_pid=_PID,
                 holder_time=self._acquire_time
             )
-        return LockInfo.from_file(self.lock_file)
+        return self._read_lock_info()
+
+    def _read_lock_info(self) -> Optional[LockInfo]:
+        """Read lock holder info, reusing a read from the last few ms
+
+        Returns:
+            LockInfo or None if the lock file is missing or unreadable
+        """
+        now = time.monotonic()
+        cached = self._info_cache
+        if cached is not None and now - cached[0] < LOCK_INFO_CACHE_TTL:
+            return cached[1]
+        info = LockInfo.from_file(self.lock_file)
+        self._info_cache = (now, info)
+        return info
 
     def __enter__(self):
         if not self.acquire():
@@ -355,6 +681,10 @@ class FileLock:
         return False
 
 
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=FileLock._reset_local_locks)
+
+
 class PheromoneManager:
     """Manages pheromone-based inter-agent communication"""
 
@@ -367,6 +697,21 @@ class PheromoneManager:
         self.hive_root = hive_root or self._find_hive_root()
         self.pheromone_file = self.hive_root / "pheromone.json"
         self.lock_file = self.hive_root / ".pheromone.lock"
+        # ((st_ino, st_mtime_ns, st_size), parsed data, worker index) of the
+        # last read/write
+        self._cache: Optional[
+            tuple[tuple[int, int, int], Dict[str, Any], Dict[str, int]]
+        ] = None
+        # Per-thread state: "held" is the FileLock taken by hold_lock(),
+        # "pending" is batch()'s [data, worker index or None when stale,
+        # dirty flag]
+        self._local = threading.local()
+        # Coalesced worker updates, keyed by worker ID (last write wins)
+        self._pending_updates: Dict[str, tuple] = {}
+        self._pending_lock = threading.Lock()
+        self._coalescer_thread: Optional[threading.Thread] = None
+        self._coalescer_wakeup = threading.Event()
+        self._stop_coalescer = threading.Event()
 
     def _find_hive_root(self) -> Path:
         """Find hive root directory"""
@@ -381,14 +726,81 @@ class PheromoneManager:
     def _read_pheromone(self) -> Dict[str, Any]:
         """Read pheromone file
 
+        The parsed file is cached against its inode, mtime and size, so
+        repeated reads of an unchanged file skip the JSON parse. Each call
+        returns a private copy that the caller may modify.
+
         Returns:
             Pheromone data dictionary
         """
-        if not self.pheromone_file.exists():
+        return self._read_pheromone_indexed()[0]
+
+    def _read_pheromone_indexed(self) -> tuple[Dict[str, Any], Dict[str, int]]:
+        """Read pheromone file along with its worker ID index
+
+        Returns:
+            Tuple of (private copy of pheromone data, worker ID -> position
+            in data["workers"]). The index is shared and must not be modified.
+            Inside batch() the batch's working data is returned uncopied.
+        """
+        pending = getattr(self._local, "pending", None)
+        if pending is not None:
+            if pending[1] is None:
+                pending[1] = _index_workers(pending[0])
+            return pending[0], pending[1]
+
+        cache = self._load_cached()
+        if cache is None:
+            return {"status": "inactive"}, {}
+        return _copy_pheromone(cache[1]), cache[2]
+
+    def _read_pheromone_ro(self) -> Dict[str, Any]:
+        """Read pheromone file without copying it
+
+        For callers that only inspect the data. The returned dict may be
+        the cache itself and must not be modified; use _read_pheromone()
+        to get a copy that can be changed and written back.
+
+        Returns:
+            Shared pheromone data dictionary
+        """
+        pending = getattr(self._local, "pending", None)
+        if pending is not None:
+            return pending[0]
+
+        cache = self._load_cached()
+        if cache is None:
             return {"status": "inactive"}
+        return cache[1]
 
-        with open(self.pheromone_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+    def _load_cached(
+        self,
+    ) -> Optional[tuple[tuple[int, int, int], Dict[str, Any], Dict[str, int]]]:
+        """Get the cache entry for the current pheromone file
+
+        Re-parses the file only when its stat key differs from the cached
+        one.
+
+        Returns:
+            Cache tuple, or None if the file does not exist
+        """
+        try:
+            st = os.stat(self.pheromone_file)
+        except FileNotFoundError:
+            return None
+
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cache = self._cache
+        if cache is None or cache[0] != key:
+            with open(self.pheromone_file, 'rb') as f:
+                if HAS_ORJSON and st.st_size >= MMAP_READ_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        with memoryview(mm) as view:
+                            data = _loads(view)
+                else:
+                    data = _loads(f.read())
+            cache = self._cache = (key, data, _index_workers(data))
+        return cache
 
     def _write_pheromone_atomic(self, data: Dict[str, Any]) -> None:
         """Write pheromone file atomically
@@ -396,33 +808,148 @@ class PheromoneManager:
         Args:
             data: Pheromone data to write
         """
-        self.hive_root.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(self.hive_root)
 
+        # Readers do not take the lock, so the file is always swapped in
+        # whole by rename rather than rewritten in place
         temp_file = self.pheromone_file.with_suffix('.tmp')
+        buf = _dumps(data)
         try:
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            temp_file.replace(self.pheromone_file)
-        finally:
-            if temp_file.exists():
-                temp_file.unlink(missing_ok=True)
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+            try:
+                fd = os.open(temp_file, flags, 0o644)
+            except FileNotFoundError:
+                # Hive root was removed since it was created; recreate it
+                _ensured_dirs.discard(self.hive_root)
+                _ensure_dir(self.hive_root)
+                fd = os.open(temp_file, flags, 0o644)
+            try:
+                view = memoryview(buf)
+                while view:
+                    view = view[os.write(fd, view):]
+                # Rename keeps inode and mtime, so the temp file's stat is the
+                # cache key the target will have after replace()
+                st = os.fstat(fd)
+            finally:
+                os.close(fd)
+            os.replace(temp_file, self.pheromone_file)
+        except BaseException:
+            # After a successful replace() the temp file is gone, so only
+            # the failure path has anything to clean up
+            temp_file.unlink(missing_ok=True)
+            raise
+
+        cached = _copy_pheromone(data)
+        self._cache = (
+            (st.st_ino, st.st_mtime_ns, st.st_size), cached, _index_workers(cached)
+        )
 
     def write_pheromone(self, data: Dict[str, Any]) -> None:
         """Write pheromone file with lock protection
 
+        Inside batch() the data only replaces the batch's working copy and
+        is written when the batch exits.
+
         Args:
             data: Pheromone data to write
         """
-        with FileLock(self.lock_file):
+        pending = getattr(self._local, "pending", None)
+        if pending is not None:
+            pending[:] = [data, None, True]
+            return
+        with self._locked():
             self._write_pheromone_atomic(data)
 
+    def _holds_lock(self) -> bool:
+        """Check whether this thread is inside batch() or hold_lock()
+
+        Such writes must not be queued for the coalescer: it would block on
+        the lock this thread holds, and reads inside the block would miss
+        the write.
+        """
+        local = self._local
+        return (
+            getattr(local, "pending", None) is not None
+            or getattr(local, "held", None) is not None
+        )
+
+    def _locked(self) -> Any:
+        """Get a context manager that holds the pheromone lock
+
+        Returns:
+            A new FileLock, or a no-op context if this thread already holds
+            the lock through hold_lock()
+        """
+        held = getattr(self._local, "held", None)
+        if held is not None:
+            # A long hold must not look abandoned to other processes
+            held.refresh()
+            return nullcontext()
+        return FileLock(self.lock_file)
+
+    @contextmanager
+    def hold_lock(self) -> Iterator[None]:
+        """Hold the pheromone lock across several operations
+
+        Writes made by this thread inside the block reuse the held lock
+        instead of opening, locking and closing the lock file each time.
+        Nested calls join the outermost one.
+
+        Example:
+            with pm.hold_lock():
+                while running:
+                    pm.update_worker_status(worker_id, cell_id, "busy", progress)
+        """
+        local = self._local
+        if getattr(local, "held", None) is not None:
+            yield
+            return
+
+        with FileLock(self.lock_file) as lock:
+            local.held = lock
+            try:
+                yield
+            finally:
+                local.held = None
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group several updates into one locked read-modify-write
+
+        Holds the pheromone lock for the whole block. Reads and writes made
+        by this thread inside the block work on one in-memory copy, which
+        is written to disk once on exit if anything changed. If the block
+        raises, the batched changes are discarded. Nested batches join the
+        outermost one.
+
+        Example:
+            with pm.batch():
+                for worker_id, cell_id in assignments:
+                    pm.update_worker_status(worker_id, cell_id, "busy")
+        """
+        local = self._local
+        if getattr(local, "pending", None) is not None:
+            yield
+            return
+
+        with self.hold_lock():
+            data, index = self._read_pheromone_indexed()
+            local.pending = [data, index, False]
+            try:
+                yield
+                data, _, dirty = local.pending
+            finally:
+                local.pending = None
+            if dirty:
+                self._write_pheromone_atomic(data)
+
     def is_hive_active(self) -> bool:
         """Check if hive mode is active
 
         Returns:
             True if hive is active
         """
-        data = self._read_pheromone()
+        data = self._read_pheromone_ro()
         return data.get("status") == "active"
 
     def get_current_cell(self) -> Optional[str]:
@@ -431,7 +958,7 @@ class PheromoneManager:
         Returns:
             Cell ID or None
         """
-        data = self._read_pheromone()
+        data = self._read_pheromone_ro()
         return data.get("current_cell")
 
     def get_worker_id(self) -> Optional[str]:
@@ -440,7 +967,7 @@ class PheromoneManager:
         Returns:
             Worker ID or None
         """
-        data = self._read_pheromone()
+        data = self._read_pheromone_ro()
         return data.get("worker_id")
 
     def update_worker_status(
@@ -453,6 +980,10 @@ class PheromoneManager:
     ) -> None:
         """Update worker status in pheromone
 
+        While the update coalescer is running, the update is queued and
+        written by the coalescer instead of immediately, unless this thread
+        is inside batch() or hold_lock().
+
         Args:
             worker_id: Worker identifier
             cell_id: Cell being worked on
@@ -460,21 +991,45 @@ class PheromoneManager:
             progress: Progress percentage
             subagent_type: Agent type
         """
-        data = self._read_pheromone()
-        now = datetime.now(timezone.utc).isoformat()
+        now = _utc_now_iso()
+        if self._coalescer_thread is not None and not self._holds_lock():
+            with self._pending_lock:
+                self._pending_updates[worker_id] = (
+                    worker_id, cell_id, status, progress, now
+                )
+            self._coalescer_wakeup.set()
+            return
 
-        workers = data.get("workers", [])
-        worker_found = False
-
-        for worker in workers:
-            if worker["id"] == worker_id:
-                worker["status"] = status
-                worker["progress"] = progress
-                worker["last_update"] = now
-                worker_found = True
-                break
+        self._apply_worker_update(worker_id, cell_id, status, progress, now)
+
+    def _apply_worker_update(
+        self,
+        worker_id: str,
+        cell_id: str,
+        status: str,
+        progress: int,
+        now: str
+    ) -> None:
+        """Write one worker status update to the pheromone file
 
-        if not worker_found:
+        Args:
+            worker_id: Worker identifier
+            cell_id: Cell being worked on
+            status: Worker status
+            progress: Progress percentage
+            now: Update timestamp
+        """
+        data, worker_idx = self._read_pheromone_indexed()
+
+        workers = data.get("workers", [])
+        pos = worker_idx.get(worker_id)
+
+        if pos is not None:
+            worker = workers[pos]
+            worker["status"] = status
+            worker["progress"] = progress
+            worker["last_update"] = now
+        else:
             workers.append({
                 "id": worker_id,
                 "cell": cell_id,
@@ -486,25 +1041,95 @@ class PheromoneManager:
         data["workers"] = workers
         self.write_pheromone(data)
 
+    # ==================== Update Coalescing ====================
+
+    def start_update_coalescer(self, window: float = 0.02) -> None:
+        """Start coalescing worker status updates
+
+        update_worker_status calls then return immediately. A background
+        thread collects the updates arriving within the window, keeps the
+        latest one per worker, and writes them all in a single batch().
+
+        Args:
+            window: Seconds to collect updates before writing them
+        """
+        if self._coalescer_thread and self._coalescer_thread.is_alive():
+            return
+
+        self._stop_coalescer.clear()
+        self._coalescer_thread = threading.Thread(
+            target=self._coalesce_loop,
+            args=(window,),
+            daemon=True
+        )
+        self._coalescer_thread.start()
+
+    def stop_update_coalescer(self) -> None:
+        """Stop coalescing and write any queued worker updates"""
+        thread = self._coalescer_thread
+        self._stop_coalescer.set()
+        self._coalescer_wakeup.set()
+
+        if thread and thread.is_alive():
+            thread.join(timeout=5.0)
+        self._coalescer_thread = None
+
+        self._flush_coalesced()
+
+    def flush_worker_updates(self) -> None:
+        """Write all queued worker status updates now"""
+        with self._pending_lock:
+            updates = self._pending_updates
+            self._pending_updates = {}
+        if not updates:
+            return
+
+        try:
+            with self.batch():
+                for update in updates.values():
+                    self._apply_worker_update(*update)
+        except BaseException:
+            # Requeue updates that were not superseded while writing
+            with self._pending_lock:
+                for worker_id, update in updates.items():
+                    self._pending_updates.setdefault(worker_id, update)
+            raise
+
+    def _coalesce_loop(self, window: float) -> None:
+        """Update coalescing loop"""
+        while not self._stop_coalescer.is_set():
+            self._coalescer_wakeup.wait()
+            self._coalescer_wakeup.clear()
+            # Collect further updates for the window, unless stopping
+            self._stop_coalescer.wait(window)
+            try:
+                self._flush_coalesced()
+            except Exception as e:
+                print(f"Worker update flush error: {e}", file=sys.stderr)
+
+    def _flush_coalesced(self) -> None:
+        """Write everything queued by the update coalescer"""
+        self.flush_worker_updates()
+
     def get_active_trails(self) -> Dict[str, Any]:
         """Get all active pheromone trails
 
         Returns:
             Dictionary containing active pheromones and worker status
         """
-        data = self._read_pheromone()
+        data = self._read_pheromone_ro()
         
-        # Get active pheromones if available
-        active_pheromones = data.get("active_pheromones", [])
+        # Copy active pheromones, collecting blockers in the same pass
+        active_pheromones = []
+        blockers = []
+        for p in data.get("active_pheromones", []):
+            p = p.copy()
+            active_pheromones.append(p)
+            if p.get("type") == "blocker":
+                blockers.append(p)
         
         # Get workers status
-        workers = data.get("workers", [])
-        
-        # Get blockers
-        blockers = [
-            p for p in active_pheromones
-            if p.get("type") == "blocker"
-        ]
+        workers = [w.copy() for w in data.get("workers", [])]
         
         return {
             "status": data.get("status", "inactive"),
@@ -522,7 +1147,7 @@ class PheromoneManager:
             "workers": [],
             "active_pheromones": [],
             "current_cell": None,
-            "last_updated": datetime.now(timezone.utc).isoformat()
+            "last_updated": _utc_now_iso()
         }
         self.write_pheromone(default_state)
 
@@ -573,7 +1198,7 @@ class PheromoneType(Enum):
     REQUEST = "request"         # Resource request
 
 
-@dataclass
+@dataclass(slots=True)
 class PheromoneEntry:
     """Single pheromone entry"""
     type: PheromoneType
@@ -583,11 +1208,18 @@ class PheromoneEntry:
     timestamp: str
     ttl: int = 300              # Time to live in seconds
     strength: float = 1.0       # Pheromone strength (decays over time)
+    timestamp_epoch: float = field(default_factory=time.time)  # timestamp as epoch seconds
+    type_str: str = field(init=False, repr=False, compare=False)  # type.value, for serialization
+
+    def __post_init__(self):
+        self.type_str = self.type.value
 
 
 class PheromoneSubscriber:
     """Subscriber for pheromone events"""
     
+    __slots__ = ("callback", "pheromone_types", "active")
+    
     def __init__(self, callback: Callable[[PheromoneEntry], None], 
                  pheromone_types: Optional[list[PheromoneType]] = None):
         """Initialize subscriber
@@ -597,7 +1229,7 @@ class PheromoneSubscriber:
             pheromone_types: Types to subscribe to (None = all types)
         """
         self.callback = callback
-        self.pheromone_types = pheromone_types or list(PheromoneType)
+        self.pheromone_types = frozenset(pheromone_types or PheromoneType)
         self.active = True
     
     def should_receive(self, entry: PheromoneEntry) -> bool:
@@ -613,6 +1245,75 @@ class PheromoneSubscriber:
                 pass  # Don't fail on callback errors
 
 
+class _WorktreeAppender:
+    """Append-mode descriptor for one worktree's incoming pheromone file
+    
+    Writes and close() are serialized on the appender's own lock, so a
+    descriptor is never closed (and its number reused) under a writer.
+    """
+    
+    __slots__ = ("fd", "file_id", "closed", "lock")
+    
+    def __init__(self):
+        self.fd: Optional[int] = None
+        self.file_id: Optional[tuple[int, int]] = None  # (st_dev, st_ino)
+        self.closed = False
+        self.lock = threading.Lock()
+    
+    def write(self, pheromone_file: Path, line: bytes) -> None:
+        """Append a line, reopening the file if it was replaced or removed
+        
+        Args:
+            pheromone_file: Incoming pheromone file of the worktree
+            line: JSON line to append
+        """
+        with self.lock:
+            if self.closed:
+                return
+            if self.fd is not None:
+                try:
+                    st = os.stat(pheromone_file)
+                    current = (st.st_dev, st.st_ino)
+                except FileNotFoundError:
+                    current = None
+                if current != self.file_id:
+                    os.close(self.fd)
+                    self.fd = None
+            if self.fd is None:
+                pheromone_file.parent.mkdir(parents=True, exist_ok=True)
+                self.fd = os.open(
+                    pheromone_file,
+                    os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0),
+                    0o644
+                )
+                st = os.fstat(self.fd)
+                self.file_id = (st.st_dev, st.st_ino)
+            
+            view = memoryview(line)
+            while view:
+                view = view[os.write(self.fd, view):]
+    
+    def close(self) -> None:
+        """Close the descriptor; later writes are dropped"""
+        with self.lock:
+            self.closed = True
+            if self.fd is not None:
+                os.close(self.fd)
+                self.fd = None
+
+
+def _close_worktree_appenders(
+    appenders: dict[Path, _WorktreeAppender],
+    lock: threading.Lock
+) -> None:
+    """Close and forget every cached worktree appender"""
+    with lock:
+        pending = list(appenders.values())
+        appenders.clear()
+    for appender in pending:
+        appender.close()
+
+
 class EnhancedPheromoneManager(PheromoneManager):
     """Enhanced pheromone manager with decay, propagation, and subscriptions
     
@@ -631,22 +1332,75 @@ class EnhancedPheromoneManager(PheromoneManager):
         """
         super().__init__(hive_root)
         
-        # Subscribers
-        self._subscribers: list[PheromoneSubscriber] = []
+        # Subscribers by pheromone type; tuples are replaced, never mutated,
+        # so notification can iterate them without copying
+        self._subs_by_type: dict[PheromoneType, tuple[PheromoneSubscriber, ...]] = {
+            t: () for t in PheromoneType
+        }
+        self._subs_lock = threading.Lock()
         
-        # History
-        self._history: list[PheromoneEntry] = []
+        # History (oldest entries are evicted once the buffer is full), plus
+        # the same entries bucketed by type and by source/target ID
         self._max_history = 1000
+        self._history: deque[PheromoneEntry] = deque(maxlen=self._max_history)
+        self._history_by_type: dict[PheromoneType, deque[PheromoneEntry]] = {}
+        self._history_by_cell: dict[str, deque[PheromoneEntry]] = {}
+        self._history_lock = threading.Lock()
+
+        # Cap on active pheromones kept in the file between decays
+        self._max_active_pheromones = 1000
+
+        # Blockers of the last parsed document: (data, blockers, targets)
+        self._blockers: Optional[tuple[Dict[str, Any], list, frozenset]] = None
+
+        # Entries emitted while the update coalescer is running
+        self._pending_entries: deque[Dict[str, Any]] = deque()
         
         # Worktree tracking
         self._worktrees: dict[str, Path] = {}
+        self._propagate_pool: Optional[ThreadPoolExecutor] = None
+        
+        # Append-mode descriptors for each worktree's incoming file, closed
+        # by close() or, failing that, when the manager is collected
+        self._worktree_fds: dict[Path, _WorktreeAppender] = {}
+        self._worktree_fds_lock = threading.Lock()
+        self._close_fds = weakref.finalize(
+            self, _close_worktree_appenders,
+            self._worktree_fds, self._worktree_fds_lock
+        )
         
         # Decay thread
         self._decay_thread: Optional[threading.Thread] = None
         self._stop_decay = threading.Event()
+        self._decay_wakeup = threading.Event()
+        # Epoch time the earliest surviving pheromone expires, as of the
+        # last decay pass (None = no active pheromones)
+        self._next_expiry: Optional[float] = None
+        
+        # Notifier thread (subscriber callbacks run here when started)
+        self._notify_thread: Optional[threading.Thread] = None
+        self._notify_q: Optional[queue.Queue] = None
     
     # ==================== Lifecycle ====================
     
+    def close(self) -> None:
+        """Stop background threads and release worktree resources
+        
+        Queued updates and notifications are written or delivered first.
+        The manager can still be used afterwards; the propagation pool and
+        worktree descriptors are recreated on demand.
+        """
+        self.stop_update_coalescer()
+        self.stop_notifier()
+        self.stop_decay_monitor()
+        
+        pool = self._propagate_pool
+        self._propagate_pool = None
+        if pool is not None:
+            pool.shutdown(wait=True)
+        
+        _close_worktree_appenders(self._worktree_fds, self._worktree_fds_lock)
+    
     def start_decay_monitor(self, interval: int = 30) -> None:
         """Start decay monitoring thread
         
@@ -667,19 +1421,82 @@ class EnhancedPheromoneManager(PheromoneManager):
     def stop_decay_monitor(self) -> None:
         """Stop decay monitoring thread"""
         self._stop_decay.set()
+        self._decay_wakeup.set()
         
         if self._decay_thread and self._decay_thread.is_alive():
             self._decay_thread.join(timeout=5.0)
     
+    def start_notifier(self, max_pending: int = 1000) -> None:
+        """Deliver subscriber notifications on a background thread
+        
+        emit() then only queues the entry, so slow callbacks no longer
+        delay the emitter. Once max_pending entries are waiting, emit()
+        blocks until the notifier catches up.
+        
+        Args:
+            max_pending: Maximum number of queued notifications
+        """
+        if self._notify_thread and self._notify_thread.is_alive():
+            return
+        
+        self._notify_q = queue.Queue(maxsize=max_pending)
+        self._notify_thread = threading.Thread(
+            target=self._notify_loop,
+            args=(self._notify_q,),
+            daemon=True
+        )
+        self._notify_thread.start()
+    
+    def stop_notifier(self) -> None:
+        """Stop the notifier thread after delivering queued notifications"""
+        thread = self._notify_thread
+        notify_q = self._notify_q
+        self._notify_thread = None
+        self._notify_q = None
+        
+        if thread and thread.is_alive():
+            notify_q.put(None)
+            thread.join(timeout=5.0)
+        
+        # Deliver anything queued by emitters that raced with the stop
+        if notify_q is not None:
+            while True:
+                try:
+                    entry = notify_q.get_nowait()
+                except queue.Empty:
+                    break
+                if entry is not None:
+                    self._deliver(entry)
+    
+    def _notify_loop(self, notify_q: queue.Queue) -> None:
+        """Notifier loop"""
+        while True:
+            entry = notify_q.get()
+            if entry is None:
+                return
+            self._deliver(entry)
+    
     def _decay_loop(self, interval: int) -> None:
         """Decay monitoring loop"""
+        idle_wait = interval
         while not self._stop_decay.is_set():
+            self._decay_wakeup.clear()
             try:
                 self.decay_pheromones()
             except Exception as e:
                 print(f"Decay error: {e}", file=sys.stderr)
             
-            self._stop_decay.wait(interval)
+            next_expiry = self._next_expiry
+            if next_expiry is None:
+                # Nothing to expire: back off until an emit wakes us
+                delay = idle_wait
+                idle_wait = min(idle_wait * 2, interval * DECAY_IDLE_BACKOFF_MAX)
+            else:
+                # Wake for the next expiry, but at least once per interval
+                idle_wait = interval
+                delay = max(DECAY_MIN_INTERVAL, min(interval, next_expiry - time.time()))
+            
+            self._decay_wakeup.wait(delay)
     
     # ==================== Pheromone Operations ====================
     
@@ -694,6 +1511,10 @@ class EnhancedPheromoneManager(PheromoneManager):
     ) -> PheromoneEntry:
         """Emit a pheromone
         
+        While the update coalescer is running, the entry is queued and
+        written together with other queued entries instead of immediately,
+        unless this thread is inside batch() or hold_lock(). Subscribers and worktrees are still notified at once.
+        
         Args:
             pheromone_type: Type of pheromone
             source: Source ID (worker/cell)
@@ -705,58 +1526,201 @@ class EnhancedPheromoneManager(PheromoneManager):
         Returns:
             Created pheromone entry
         """
+        now_ns = time.time_ns()
         entry = PheromoneEntry(
             type=pheromone_type,
             source=source,
             target=target,
             data=data,
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=_utc_now_iso(now_ns),
             ttl=ttl,
-            strength=strength
+            strength=strength,
+            timestamp_epoch=now_ns / 1e9
         )
         
+        # File record, built once and shared by the pheromone file and the
+        # worktree broadcast
+        record = {
+            "type": entry.type_str,
+            "source": source,
+            "target": target,
+            "data": data,
+            "timestamp": entry.timestamp,
+            "timestamp_epoch": entry.timestamp_epoch,
+            "ttl": ttl,
+            "strength": strength
+        }
+        
         # Add to history
         self._add_to_history(entry)
         
+        # Wake an idle decay monitor so it schedules this entry's expiry
+        if self._next_expiry is None and self._decay_thread is not None:
+            self._decay_wakeup.set()
+        
         # Write to pheromone file
-        self._write_entry(entry)
+        if self._coalescer_thread is not None and not self._holds_lock():
+            with self._pending_lock:
+                self._pending_entries.append(record)
+            self._coalescer_wakeup.set()
+        else:
+            self._write_entry(record)
         
         # Notify subscribers
         self._notify_subscribers(entry)
         
         # Propagate to worktrees if broadcast
         if target is None:
-            self._propagate_to_worktrees(entry)
+            self._propagate_to_worktrees(record)
         
         return entry
     
-    def _write_entry(self, entry: PheromoneEntry) -> None:
-        """Write pheromone entry to file"""
+    def _write_entry(self, record: Dict[str, Any]) -> None:
+        """Write pheromone entry to file
+        
+        Args:
+            record: Pheromone record built by emit()
+        """
         data = self._read_pheromone()
         
         # Add to active pheromones
         if "active_pheromones" not in data:
             data["active_pheromones"] = []
         
-        data["active_pheromones"].append({
-            "type": entry.type.value,
-            "source": entry.source,
-            "target": entry.target,
-            "data": entry.data,
-            "timestamp": entry.timestamp,
-            "ttl": entry.ttl,
-            "strength": entry.strength
-        })
+        active = data["active_pheromones"]
+        active.append(record)
+        
+        # Keep the file size bounded even when no decay monitor is running
+        if len(active) > self._max_active_pheromones:
+            self._trim_active(active)
         
         self.write_pheromone(data)
     
+    def _trim_active(self, active: list[Dict[str, Any]]) -> None:
+        """Shrink an over-cap active pheromone list in place
+        
+        Expired entries go first, then the oldest non-blocker entries.
+        Unexpired blockers are never dropped, since resolve_blocker() and
+        the blocker index depend on them, so the list may stay over the
+        cap while enough blockers are active.
+        
+        Args:
+            active: Active pheromone records, oldest first
+        """
+        now = time.time()
+        kept = []
+        for p in active:
+            try:
+                epoch = p.get("timestamp_epoch")
+                if epoch is None:
+                    epoch = _iso_to_epoch(p.get("timestamp", ""))
+                if now - epoch >= p.get("ttl", 300):
+                    continue
+            except (ValueError, TypeError):
+                # Invalid timestamp, consider expired (as decay does)
+                continue
+            kept.append(p)
+        
+        excess = len(kept) - self._max_active_pheromones
+        if excess > 0:
+            trimmed = []
+            for p in kept:
+                if excess > 0 and p.get("type") != "blocker":
+                    excess -= 1
+                    continue
+                trimmed.append(p)
+            kept = trimmed
+        
+        active[:] = kept
+    
+    def flush_pending_entries(self) -> None:
+        """Write all queued pheromone entries in one read-modify-write
+        
+        Methods that read or rewrite active_pheromones call this first, so
+        entries queued by the update coalescer are never missed or written
+        back over.
+        """
+        if not self._pending_entries:
+            return
+        with self._pending_lock:
+            records = list(self._pending_entries)
+            self._pending_entries.clear()
+        if not records:
+            return
+
+        try:
+            with self.batch():
+                for record in records:
+                    self._write_entry(record)
+        except BaseException:
+            # Put the entries back ahead of anything queued meanwhile
+            with self._pending_lock:
+                self._pending_entries.extendleft(reversed(records))
+            raise
+
+    def _flush_coalesced(self) -> None:
+        """Write queued worker updates and pheromone entries together"""
+        if not self._pending_updates and not self._pending_entries:
+            return
+        with self.batch():
+            self.flush_worker_updates()
+            self.flush_pending_entries()
+
+    def get_active_trails(self) -> Dict[str, Any]:
+        """Get all active pheromone trails, including queued entries
+        
+        Returns:
+            Dictionary containing active pheromones and worker status
+        """
+        self.flush_pending_entries()
+        return super().get_active_trails()
+    
+    def clear_all(self) -> None:
+        """Clear all pheromone trails, dropping queued entries too"""
+        with self._pending_lock:
+            self._pending_entries.clear()
+        super().clear_all()
+    
     def _add_to_history(self, entry: PheromoneEntry) -> None:
         """Add entry to history"""
-        self._history.append(entry)
+        with self._history_lock:
+            history = self._history
+            if len(history) == history.maxlen:
+                # The evicted entry is the oldest one in each of its buckets
+                self._unbucket(history[0])
+            history.append(entry)
+            
+            self._history_by_type.setdefault(entry.type, deque()).append(entry)
+            for cell_id in self._history_cells(entry):
+                self._history_by_cell.setdefault(cell_id, deque()).append(entry)
+    
+    def _unbucket(self, entry: PheromoneEntry) -> None:
+        """Remove the oldest history entry from its buckets
+        
+        Args:
+            entry: Entry about to be evicted from history
+        """
+        buckets = [(self._history_by_type, entry.type)]
+        buckets.extend((self._history_by_cell, c) for c in self._history_cells(entry))
+        for index, key in buckets:
+            bucket = index[key]
+            bucket.popleft()
+            if not bucket:
+                del index[key]
+    
+    @staticmethod
+    def _history_cells(entry: PheromoneEntry) -> tuple[str, ...]:
+        """Get the IDs a history entry is bucketed under
         
-        # Trim history if needed
-        if len(self._history) > self._max_history:
-            self._history = self._history[-self._max_history:]
+        Args:
+            entry: Pheromone entry
+            
+        Returns:
+            Distinct source and target IDs
+        """
+        if entry.target is None or entry.target == entry.source:
+            return (entry.source,)
+        return (entry.source, entry.target)
     
     # ==================== Decay ====================
     
@@ -769,29 +1733,40 @@ class EnhancedPheromoneManager(PheromoneManager):
         Returns:
             Number of expired pheromones
         """
+        self.flush_pending_entries()
         data = self._read_pheromone()
-        now = datetime.now(timezone.utc)
+        now = time.time()
         
         active = data.get("active_pheromones", [])
         surviving = []
         expired = 0
+        changed = False
+        next_expiry = None
         
         for p in active:
             try:
-                # Calculate age
-                ts = p.get("timestamp", "")
-                if ts.endswith('Z'):
-                    ts = ts[:-1] + '+00:00'
-                entry_time = datetime.fromisoformat(ts)
-                age_seconds = (now - entry_time).total_seconds()
+                # Calculate age; entries written before timestamp_epoch
+                # existed only carry the ISO string
+                epoch = p.get("timestamp_epoch")
+                if epoch is None:
+                    epoch = _iso_to_epoch(p.get("timestamp", ""))
+                age_seconds = now - epoch
                 
                 # Check TTL
                 entry_ttl = ttl if ttl is not None else p.get("ttl", 300)
                 
                 if age_seconds < entry_ttl:
+                    expiry = epoch + entry_ttl
+                    if next_expiry is None or expiry < next_expiry:
+                        next_expiry = expiry
+                    
                     # Decay strength
                     decay_factor = 1.0 - (age_seconds / entry_ttl)
-                    p["strength"] = p.get("strength", 1.0) * decay_factor
+                    strength = p.get("strength", 1.0)
+                    decayed = strength * decay_factor
+                    if abs(strength - decayed) > DECAY_STRENGTH_EPSILON:
+                        p["strength"] = decayed
+                        changed = True
                     surviving.append(p)
                 else:
                     expired += 1
@@ -799,8 +1774,12 @@ class EnhancedPheromoneManager(PheromoneManager):
                 # Invalid timestamp, consider expired
                 expired += 1
         
-        data["active_pheromones"] = surviving
-        self.write_pheromone(data)
+        self._next_expiry = next_expiry
+        
+        # Leave the file alone when the decay pass changed nothing
+        if expired or changed:
+            data["active_pheromones"] = surviving
+            self.write_pheromone(data)
         
         return expired
     
@@ -821,38 +1800,82 @@ class EnhancedPheromoneManager(PheromoneManager):
         Args:
             worktree_id: Worktree identifier
         """
-        self._worktrees.pop(worktree_id, None)
+        path = self._worktrees.pop(worktree_id, None)
+        if path is None or path in self._worktrees.values():
+            return
+        
+        with self._worktree_fds_lock:
+            appender = self._worktree_fds.pop(path, None)
+        if appender is not None:
+            appender.close()
     
-    def _propagate_to_worktrees(self, entry: PheromoneEntry) -> None:
+    def _propagate_to_worktrees(self, record: Dict[str, Any]) -> None:
         """Propagate pheromone to all registered worktrees
         
+        The line is serialized once and appended to every worktree. With
+        more than one worktree the appends run in parallel on a shared
+        thread pool; this returns once all of them have finished.
+        
         Args:
-            entry: Pheromone entry to propagate
+            record: Pheromone record built by emit()
         """
-        for worktree_id, worktree_path in self._worktrees.items():
+        worktree_paths = list(self._worktrees.values())
+        if not worktree_paths:
+            return
+        
+        line = _dumps_line(record)
+        
+        if len(worktree_paths) == 1:
             try:
-                self._write_to_worktree(worktree_path, entry)
+                self._write_to_worktree(worktree_paths[0], line)
             except Exception:
                 pass  # Don't fail on propagation errors
+            return
+        
+        pool = self._propagate_pool
+        if pool is None:
+            pool = self._propagate_pool = ThreadPoolExecutor(
+                thread_name_prefix="pheromone-propagate"
+            )
+        
+        # Propagation errors are left on the futures and never raised
+        futures = []
+        for i, path in enumerate(worktree_paths):
+            try:
+                futures.append(pool.submit(self._write_to_worktree, path, line))
+            except RuntimeError:
+                # Pool shut down by a concurrent close(); finish inline
+                for path in worktree_paths[i:]:
+                    try:
+                        self._write_to_worktree(path, line)
+                    except Exception:
+                        pass
+                break
+        wait(futures)
     
-    def _write_to_worktree(self, worktree_path: Path, entry: PheromoneEntry) -> None:
-        """Write pheromone to worktree's pheromone file
+    def _write_to_worktree(self, worktree_path: Path, line: bytes) -> None:
+        """Append a serialized pheromone to a worktree's pheromone file
+        
+        The file stays open in O_APPEND mode until the worktree is
+        unregistered, so each line is a single write() that the kernel
+        appends atomically. A file that was deleted or replaced since it
+        was opened is reopened at its path.
         
         Args:
             worktree_path: Path to worktree
-            entry: Pheromone entry
+            line: JSON line to append
         """
-        pheromone_file = worktree_path / ".trellis" / "incoming_pheromones.jsonl"
-        pheromone_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(pheromone_file, 'a', encoding='utf-8') as f:
-            f.write(json.dumps({
-                "type": entry.type.value,
-                "source": entry.source,
-                "target": entry.target,
-                "data": entry.data,
-                "timestamp": entry.timestamp
-            }, ensure_ascii=False) + "\n")
+        with self._worktree_fds_lock:
+            appender = self._worktree_fds.get(worktree_path)
+            if appender is None:
+                # Unregistered since the broadcast started
+                if worktree_path not in self._worktrees.values():
+                    return
+                appender = self._worktree_fds[worktree_path] = _WorktreeAppender()
+        
+        appender.write(
+            worktree_path / ".trellis" / "incoming_pheromones.jsonl", line
+        )
     
     # ==================== Subscription ====================
     
@@ -871,7 +1894,9 @@ class EnhancedPheromoneManager(PheromoneManager):
             Subscriber instance
         """
         subscriber = PheromoneSubscriber(callback, pheromone_types)
-        self._subscribers.append(subscriber)
+        with self._subs_lock:
+            for t in subscriber.pheromone_types:
+                self._subs_by_type[t] += (subscriber,)
         return subscriber
     
     def unsubscribe(self, subscriber: PheromoneSubscriber) -> None:
@@ -881,8 +1906,11 @@ class EnhancedPheromoneManager(PheromoneManager):
             subscriber: Subscriber to remove
         """
         subscriber.active = False
-        if subscriber in self._subscribers:
-            self._subscribers.remove(subscriber)
+        with self._subs_lock:
+            for t in subscriber.pheromone_types:
+                self._subs_by_type[t] = tuple(
+                    s for s in self._subs_by_type[t] if s is not subscriber
+                )
     
     def _notify_subscribers(self, entry: PheromoneEntry) -> None:
         """Notify all subscribers of new pheromone
@@ -890,7 +1918,19 @@ class EnhancedPheromoneManager(PheromoneManager):
         Args:
             entry: Pheromone entry
         """
-        for subscriber in self._subscribers:
+        notify_q = self._notify_q
+        if notify_q is not None:
+            notify_q.put(entry)
+        else:
+            self._deliver(entry)
+    
+    def _deliver(self, entry: PheromoneEntry) -> None:
+        """Run the callbacks of subscribers to the entry's type
+        
+        Args:
+            entry: Pheromone entry
+        """
+        for subscriber in self._subs_by_type[entry.type]:
             subscriber.notify(entry)
     
     # ==================== Blocking Pheromones ====================
@@ -915,7 +1955,7 @@ class EnhancedPheromoneManager(PheromoneManager):
             pheromone_type=PheromoneType.BLOCKER,
             source=source,
             target=cell_id,
-            data={"reason": reason, "blocked_at": datetime.now(timezone.utc).isoformat()},
+            data={"reason": reason, "blocked_at": _utc_now_iso()},
             ttl=600,  # 10 minutes
             strength=1.0
         )
@@ -931,11 +1971,16 @@ class EnhancedPheromoneManager(PheromoneManager):
             pheromone_type=PheromoneType.COMPLETION,
             source=source,
             target=cell_id,
-            data={"resolved": True, "resolved_at": datetime.now(timezone.utc).isoformat()},
+            data={"resolved": True, "resolved_at": _utc_now_iso()},
             ttl=60
         )
         
-        # Remove from active blockers
+        # Remove from active blockers; nothing to rewrite if the cell has none.
+        # _index_blockers() flushes queued entries, including the blocker
+        # itself if it was emitted while the coalescer runs
+        if cell_id not in self._index_blockers()[1]:
+            return
+        
         data = self._read_pheromone()
         active = data.get("active_pheromones", [])
         
@@ -952,13 +1997,33 @@ class EnhancedPheromoneManager(PheromoneManager):
         Returns:
             List of blocker pheromones
         """
-        data = self._read_pheromone()
-        active = data.get("active_pheromones", [])
+        # Copy only the matching records so callers cannot alter the cache
+        return [p.copy() for p in self._index_blockers()[0]]
+    
+    def _index_blockers(self) -> tuple[list, frozenset]:
+        """Get the active blocker records and their targets
         
-        return [
-            p for p in active
+        The scan is done once per parse of the pheromone file and reused
+        until the file changes. Inside batch() the working copy is scanned
+        on every call, since it can change in place.
+        
+        Returns:
+            (blocker records in file order, set of blocked targets)
+        """
+        self.flush_pending_entries()
+        data = self._read_pheromone_ro()
+        cached = self._blockers
+        if cached is not None and cached[0] is data:
+            return cached[1], cached[2]
+        
+        blockers = [
+            p for p in data.get("active_pheromones", [])
             if p.get("type") == "blocker"
         ]
+        targets = frozenset(p.get("target") for p in blockers)
+        if getattr(self._local, "pending", None) is None:
+            self._blockers = (data, blockers, targets)
+        return blockers, targets
     
     # ==================== History ====================
     
@@ -978,19 +2043,36 @@ class EnhancedPheromoneManager(PheromoneManager):
         Returns:
             List of pheromone entries
         """
-        filtered = self._history
-        
-        if cell_id:
-            filtered = [e for e in filtered if e.source == cell_id or e.target == cell_id]
-        
-        if pheromone_type:
-            filtered = [e for e in filtered if e.type == pheromone_type]
-        
-        return filtered[-limit:]
+        with self._history_lock:
+            # Walk the smallest bucket that satisfies a filter and check
+            # the other filter on its entries only
+            by_cell = self._history_by_cell.get(cell_id, ()) if cell_id else None
+            by_type = (
+                self._history_by_type.get(pheromone_type, ()) if pheromone_type else None
+            )
+            
+            if by_cell is not None and (by_type is None or len(by_cell) <= len(by_type)):
+                filtered = iter(by_cell)
+                if by_type is not None:
+                    filtered = (e for e in filtered if e.type == pheromone_type)
+            elif by_type is not None:
+                filtered = iter(by_type)
+                if by_cell is not None:
+                    filtered = (e for e in filtered if e.source == cell_id or e.target == cell_id)
+            else:
+                filtered = iter(self._history)
+            
+            if limit > 0:
+                # Keep only the newest matches instead of materializing them all
+                return list(deque(filtered, maxlen=limit))
+            return list(filtered)[-limit:]
     
     def clear_history(self) -> None:
         """Clear pheromone history"""
-        self._history.clear()
+        with self._history_lock:
+            self._history = deque(maxlen=self._max_history)
+            self._history_by_type.clear()
+            self._history_by_cell.clear()
 
 
 # Global enhanced instance
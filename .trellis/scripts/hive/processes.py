@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Worker Process Registry
+
+Holds subprocess handles for workers outside the Worker dataclass, so the
+shared models stay free of non-serializable state and do not need to
+import subprocess.
+
+Usage:
+    from hive.processes import WorkerProcesses
+
+    processes = WorkerProcesses()
+    processes.register(worker.id, process)
+    process = processes.get(worker.id)
+"""
+
+from __future__ import annotations
+
+import subprocess
+import threading
+from typing import Optional
+
+
+class WorkerProcesses:
+    """Registry of worker subprocess handles keyed by worker ID
+
+    Each scheduler or pool owns its own registry, since worker IDs are only
+    unique within their owner. Handles are held strongly until popped so a
+    timed-out process can still be terminated during cleanup.
+    """
+
+    def __init__(self):
+        self._processes: dict[str, subprocess.Popen] = {}
+        self._lock = threading.Lock()
+
+    def register(self, worker_id: str, process: subprocess.Popen) -> None:
+        """Register the process handle for a worker
+
+        Args:
+            worker_id: Worker ID
+            process: Subprocess handle
+        """
+        with self._lock:
+            self._processes[worker_id] = process
+
+    def get(self, worker_id: str) -> Optional[subprocess.Popen]:
+        """Get the process handle for a worker
+
+        Args:
+            worker_id: Worker ID
+
+        Returns:
+            Subprocess handle or None if not registered
+        """
+        return self._processes.get(worker_id)
+
+    def pop(self, worker_id: str) -> Optional[subprocess.Popen]:
+        """Remove and return the process handle for a worker
+
+        Args:
+            worker_id: Worker ID
+
+        Returns:
+            Subprocess handle or None if not registered
+        """
+        with self._lock:
+            return self._processes.pop(worker_id, None)
+
+    def items(self) -> list[tuple[str, subprocess.Popen]]:
+        """Get a snapshot of registered (worker_id, process) pairs
+
+        Returns:
+            List of (worker_id, process) tuples
+        """
+        with self._lock:
+            return list(self._processes.items())
+
+
+__all__ = ["WorkerProcesses"]
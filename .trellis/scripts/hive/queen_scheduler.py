@@ -26,6 +26,7 @@ import subprocess
 import sys
 import threading
 import time
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional, Callable
@@ -37,7 +38,8 @@ from queue import Queue, Empty
 from .hive_config import HiveConfig, get_config
 from .cell_manager import CellManager, Cell, CellNotFoundError
 from .pheromone import PheromoneManager, get_pheromone_manager
-from .models import WorkerState, Worker, WorkerTask, TaskPriority, HiveError
+from .models import WorkerState, Worker, WorkerTask, TaskPriority, HiveError, ns_to_iso
+from .processes import WorkerProcesses
 
 
 # Configure logging
@@ -155,12 +157,26 @@ class QueenScheduler:
         self.state = SchedulerState.IDLE
         self.workers: dict[str, Worker] = {}
         self.worker_counter = 0
+        self._processes = WorkerProcesses()
+        # (status, workers) last written by coordinate_pheromone_sync and the
+        # pheromone file's (st_ino, st_mtime_ns, st_size) right after it
+        self._last_sync: Optional[tuple[Any, tuple[int, int, int]]] = None
+        # Set whenever a worker changes state; cleared by each sync
+        self._sync_dirty = True
         
         # Threading
         self._executor: Optional[ThreadPoolExecutor] = None
         self._heartbeat_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         self._dispatch_lock = threading.Lock()  # Protects dispatch operations
+        # Idle and busy worker IDs as insertion-ordered sets, kept in step
+        # with worker.state by _set_worker_state()
+        self._idle_ids: dict[str, None] = {}
+        self._busy_ids: dict[str, None] = {}
+        self._state_lock = threading.Lock()
+        # Notified on worker state transitions and on stop, so the heartbeat
+        # loop wakes for real changes instead of only on its interval
+        self._worker_state_cv = threading.Condition(self._state_lock)
         
         # Callbacks
         self._on_cell_complete: Optional[Callable[[str], None]] = None
@@ -281,6 +297,8 @@ class QueenScheduler:
             return
         
         self._stop_event.set()
+        with self._worker_state_cv:
+            self._worker_state_cv.notify_all()
         self.state = SchedulerState.STOPPED
         
         logger.info("Stopping queen scheduler...")
@@ -318,7 +336,7 @@ class QueenScheduler:
         
         for worker_id, worker in list(self.workers.items()):
             self._cleanup_worker_process(worker, wait and not force, timeout / 2)
-            worker.state = WorkerState.STOPPED
+            self._set_worker_state(worker, WorkerState.STOPPED)
         
         # If force and still have processes, kill them
         if force:
@@ -326,9 +344,9 @@ class QueenScheduler:
             if remaining_time > 0:
                 time.sleep(min(remaining_time, 2.0))
             
-            for worker in self.workers.values():
-                if worker.process and worker.process.poll() is None:
-                    self._kill_process_tree(worker.process)
+            for _, process in self._processes.items():
+                if process.poll() is None:
+                    self._kill_process_tree(process)
     
     def _cleanup_worker_process(self, worker: Worker, wait: bool = True, timeout: float = 10.0) -> None:
         """Clean up a single worker process
@@ -338,27 +356,27 @@ class QueenScheduler:
             wait: Wait for process to terminate
             timeout: Maximum wait time
         """
-        if worker.process is None:
+        # Popping clears the process reference whatever happens below
+        process = self._processes.pop(worker.id)
+        if process is None:
             return
         
         try:
             # Try graceful termination first
-            if worker.process.poll() is None:
-                worker.process.terminate()
+            if process.poll() is None:
+                process.terminate()
                 
                 if wait:
                     try:
-                        worker.process.wait(timeout=timeout / 2)
+                        process.wait(timeout=timeout / 2)
                         logger.debug(f"Worker process {worker.id} terminated gracefully")
                     except subprocess.TimeoutExpired:
                         # Force kill if terminate didn't work
-                        self._kill_process_tree(worker.process)
+                        self._kill_process_tree(process)
                         logger.warning(f"Worker process {worker.id} force killed")
                         
         except (OSError, subprocess.SubprocessError) as e:
             logger.debug(f"Worker process cleanup error: {e}")
-        finally:
-            worker.process = None
     
     def _kill_process_tree(self, process: subprocess.Popen) -> None:
         """Kill a process and all its children
@@ -407,18 +425,44 @@ class QueenScheduler:
         """Initialize worker pool"""
         for i in range(self.max_workers):
             worker_id = f"worker-{i+1}"
-            self.workers[worker_id] = Worker(id=worker_id)
+            worker = self.workers[worker_id] = Worker(id=worker_id)
+            self._set_worker_state(worker, worker.state)
+    
+    def _set_worker_state(self, worker: Worker, state: WorkerState) -> None:
+        """Change a worker's state and keep the idle/busy indexes current
+        
+        All worker state changes in the scheduler go through here. Set the
+        worker's other fields before calling this: the change marks the
+        sync dirty and wakes the heartbeat loop, which may snapshot the
+        worker and check its heartbeat straight away.
+        
+        Args:
+            worker: Worker to update
+            state: New state
+        """
+        worker_id = worker.id
+        with self._state_lock:
+            worker.state = state
+            self._sync_dirty = True
+            self._worker_state_cv.notify_all()
+            self._idle_ids.pop(worker_id, None)
+            self._busy_ids.pop(worker_id, None)
+            if state == WorkerState.IDLE:
+                self._idle_ids[worker_id] = None
+            elif state == WorkerState.BUSY:
+                self._busy_ids[worker_id] = None
     
     def get_idle_workers(self) -> list[Worker]:
         """Get list of idle workers
         
+        Workers are returned in the order they became idle, so dispatch
+        rotates through the pool.
+        
         Returns:
             List of idle workers
         """
-        return [
-            w for w in self.workers.values()
-            if w.state == WorkerState.IDLE
-        ]
+        with self._state_lock:
+            return [self.workers[w_id] for w_id in self._idle_ids]
     
     def get_busy_workers(self) -> list[Worker]:
         """Get list of busy workers
@@ -426,10 +470,8 @@ class QueenScheduler:
         Returns:
             List of busy workers
         """
-        return [
-            w for w in self.workers.values()
-            if w.state == WorkerState.BUSY
-        ]
+        with self._state_lock:
+            return [self.workers[w_id] for w_id in self._busy_ids]
     
     def assign_cell_to_worker(self, worker: Worker, cell: dict[str, Any]) -> bool:
         """Assign a cell to a worker
@@ -448,11 +490,11 @@ class QueenScheduler:
         worktree_path = cell.get("worktree_path")
         
         worker.cell_id = cell_id
-        worker.state = WorkerState.BUSY
         worker.progress = 0
-        worker.started_at = datetime.now(timezone.utc).isoformat()
-        worker.last_heartbeat = worker.started_at
+        worker.update_heartbeat()
+        worker.started_at = worker.last_heartbeat
         worker.worktree_path = worktree_path
+        self._set_worker_state(worker, WorkerState.BUSY)
         
         # Update cell status
         self.cell_manager.update_cell_status(cell_id, "in_progress")
@@ -487,9 +529,9 @@ class QueenScheduler:
         
         # Reset worker
         worker.cell_id = None
-        worker.state = WorkerState.IDLE
         worker.progress = 0
         worker.worktree_path = None
+        self._set_worker_state(worker, WorkerState.IDLE)
         
         # Update pheromone
         self.pheromone_manager.update_worker_status(
@@ -619,7 +661,7 @@ class QueenScheduler:
                 text=True
             )
             
-            worker.process = process
+            self._processes.register(worker_id, process)
             
             # Wait for completion
             stdout, stderr = process.communicate(timeout=self.config.worker.timeout)
@@ -642,12 +684,12 @@ class QueenScheduler:
             }
             
         except subprocess.TimeoutExpired:
-            worker.state = WorkerState.TIMEOUT
+            self._set_worker_state(worker, WorkerState.TIMEOUT)
             self.release_worker(worker_id, success=False)
             return {"success": False, "error": "timeout", "cell_id": cell_id}
             
         except Exception as e:
-            worker.state = WorkerState.ERROR
+            self._set_worker_state(worker, WorkerState.ERROR)
             self.release_worker(worker_id, success=False)
             
             if self._on_error:
@@ -713,14 +755,15 @@ class QueenScheduler:
             Scheduler statistics
         """
         cells = self.cell_manager.list_cells()
+        counts = Counter(c["status"] for c in cells)
         
         stats = SchedulerStats(
             total_cells=len(cells),
-            completed_cells=sum(1 for c in cells if c["status"] == "completed"),
-            pending_cells=sum(1 for c in cells if c["status"] == "pending"),
-            blocked_cells=sum(1 for c in cells if c["status"] == "blocked"),
-            active_workers=len(self.get_busy_workers()),
-            idle_workers=len(self.get_idle_workers())
+            completed_cells=counts["completed"],
+            pending_cells=counts["pending"],
+            blocked_cells=counts["blocked"],
+            active_workers=len(self._busy_ids),
+            idle_workers=len(self._idle_ids)
         )
         
         return stats
@@ -749,7 +792,7 @@ class QueenScheduler:
                     "state": w.state.value,
                     "cell_id": w.cell_id,
                     "progress": w.progress,
-                    "last_heartbeat": w.last_heartbeat
+                    "last_heartbeat": ns_to_iso(w.last_heartbeat)
                 }
                 for w_id, w in self.workers.items()
             }
@@ -783,7 +826,7 @@ class QueenScheduler:
         
         # Update worker state
         if blocked_worker:
-            blocked_worker.state = WorkerState.BLOCKED
+            self._set_worker_state(blocked_worker, WorkerState.BLOCKED)
         
         # Write blocker pheromone
         self._write_blocker_pheromone(cell_id, reason)
@@ -818,7 +861,7 @@ class QueenScheduler:
         # Release blocked worker
         for worker in self.workers.values():
             if worker.cell_id == cell_id:
-                worker.state = WorkerState.IDLE
+                self._set_worker_state(worker, WorkerState.IDLE)
                 break
         
         return True
@@ -826,23 +869,60 @@ class QueenScheduler:
     # ==================== Pheromone Sync ====================
     
     def coordinate_pheromone_sync(self) -> None:
-        """Coordinate pheromone synchronization across all workers"""
+        """Coordinate pheromone synchronization across all workers
+        
+        The write is skipped when neither the scheduler and worker state
+        nor the pheromone file has changed since the last sync, so an idle
+        heartbeat loop does not rewrite the whole file every interval. While
+        no worker has changed state since the last sync, the worker snapshot
+        is not even rebuilt; worker fields should therefore be changed
+        through the scheduler's methods.
+        """
+        status = self.state.value
+        pheromone_file = self.pheromone_manager.pheromone_file
+        last = self._last_sync
+        if last is not None and not self._sync_dirty and last[0][0] == status:
+            try:
+                st = os.stat(pheromone_file)
+                if (st.st_ino, st.st_mtime_ns, st.st_size) == last[1]:
+                    return
+            except FileNotFoundError:
+                pass
+        
+        # Cleared before the snapshot so changes made meanwhile stay marked
+        self._sync_dirty = False
+        workers = [
+            {
+                "id": w.id,
+                "state": w.state.value,
+                "cell_id": w.cell_id,
+                "progress": w.progress,
+                "last_heartbeat": ns_to_iso(w.last_heartbeat)
+            }
+            for w in self.workers.values()
+        ]
+        
+        if last is not None and last[0] == (status, workers):
+            try:
+                st = os.stat(pheromone_file)
+                if (st.st_ino, st.st_mtime_ns, st.st_size) == last[1]:
+                    return
+            except FileNotFoundError:
+                pass
+        
         data = {
-            "status": self.state.value,
+            "status": status,
             "timestamp": datetime.now(timezone.utc).isoformat(),
-            "workers": [
-                {
-                    "id": w.id,
-                    "state": w.state.value,
-                    "cell_id": w.cell_id,
-                    "progress": w.progress,
-                    "last_heartbeat": w.last_heartbeat
-                }
-                for w in self.workers.values()
-            ]
+            "workers": workers
         }
         
         self.pheromone_manager.write_pheromone(data)
+        try:
+            st = os.stat(pheromone_file)
+        except FileNotFoundError:
+            self._last_sync = None
+        else:
+            self._last_sync = ((status, workers), (st.st_ino, st.st_mtime_ns, st.st_size))
     
     def _update_pheromone_status(self, status: str) -> None:
         """Update pheromone status"""
@@ -868,52 +948,57 @@ class QueenScheduler:
     # ==================== Heartbeat ====================
     
     def _heartbeat_loop(self) -> None:
-        """Heartbeat monitoring loop"""
+        """Heartbeat monitoring loop
+        
+        Runs every heartbeat interval, or sooner when a worker changes
+        state, so transitions reach the pheromone file without waiting
+        out the interval.
+        """
+        interval = self.config.pheromone.heartbeat_interval
         while not self._stop_event.is_set():
             try:
                 self._check_worker_heartbeats()
                 self.coordinate_pheromone_sync()
             except Exception as e:
                 logger.error(f"Heartbeat error: {e}", exc_info=True)
+                # Back off a full interval rather than spin on a dirty flag
+                # the failed sync never cleared
+                self._stop_event.wait(interval)
+                continue
             
-            # Wait for next heartbeat interval
-            self._stop_event.wait(self.config.pheromone.heartbeat_interval)
+            # Wait for a worker transition, stop, or the next interval
+            with self._worker_state_cv:
+                self._worker_state_cv.wait_for(
+                    lambda: self._sync_dirty or self._stop_event.is_set(),
+                    timeout=interval
+                )
     
     def _check_worker_heartbeats(self) -> None:
         """Check worker heartbeats and detect timeouts"""
-        now = datetime.now(timezone.utc)
+        now_mono = time.monotonic_ns()
+        now_ns = time.time_ns()
         timeout_seconds = self.config.pheromone.timeout
         
-        for worker in self.workers.values():
-            if worker.state != WorkerState.BUSY:
-                continue
-            
-            if not worker.last_heartbeat:
+        for worker in self.get_busy_workers():
+            elapsed = worker.heartbeat_age(now_mono, now_ns)
+            if elapsed is None:
                 continue
             
-            try:
-                # Parse heartbeat time
-                hb_time = datetime.fromisoformat(worker.last_heartbeat.replace('Z', '+00:00'))
-                elapsed = (now - hb_time).total_seconds()
+            if elapsed > timeout_seconds:
+                self._set_worker_state(worker, WorkerState.TIMEOUT)
+                logger.warning(
+                    f"Worker {worker.id} heartbeat timeout "
+                    f"(elapsed: {elapsed:.1f}s, threshold: {timeout_seconds}s)"
+                )
                 
-                if elapsed > timeout_seconds:
-                    worker.state = WorkerState.TIMEOUT
-                    logger.warning(
-                        f"Worker {worker.id} heartbeat timeout "
-                        f"(elapsed: {elapsed:.1f}s, threshold: {timeout_seconds}s)"
+                # Persist heartbeat event
+                self._persist_heartbeat_event(worker, elapsed, timeout_seconds)
+                
+                if worker.cell_id:
+                    self.handle_blocker(
+                        worker.cell_id,
+                        f"worker_timeout: {worker.id}"
                     )
-                    
-                    # Persist heartbeat event
-                    self._persist_heartbeat_event(worker, elapsed, timeout_seconds)
-                    
-                    if worker.cell_id:
-                        self.handle_blocker(
-                            worker.cell_id,
-                            f"worker_timeout: {worker.id}"
-                        )
-            except (ValueError, TypeError) as e:
-                logger.debug(f"Failed to parse heartbeat for worker {worker.id}: {e}")
-                continue
     
     def _persist_heartbeat_event(
         self,
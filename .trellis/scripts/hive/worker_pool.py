@@ -26,7 +26,7 @@ import sys
 import threading
 import time
 import uuid
-from datetime import datetime, timezone
+from collections import deque
 from pathlib import Path
 from typing import Any, Optional, Callable, Iterator
 from dataclasses import dataclass, field
@@ -35,7 +35,8 @@ from queue import Queue, Empty
 from concurrent.futures import Future
 
 from .hive_config import HiveConfig, get_config
-from .models import WorkerState, Worker, WorkerTask, TaskPriority, HiveError
+from .models import WorkerState, Worker, WorkerTask, TaskPriority, HiveError, ns_to_iso
+from .processes import WorkerProcesses
 
 
 # WorkerState, TaskPriority, WorkerTask, Worker are now imported from .models
@@ -68,10 +69,10 @@ class TaskQueue:
     """Priority-based task queue"""
     
     def __init__(self):
-        self._queues: dict[TaskPriority, list[WorkerTask]] = {
-            TaskPriority.HIGH: [],
-            TaskPriority.MEDIUM: [],
-            TaskPriority.LOW: []
+        self._queues: dict[TaskPriority, deque[WorkerTask]] = {
+            TaskPriority.HIGH: deque(),
+            TaskPriority.MEDIUM: deque(),
+            TaskPriority.LOW: deque()
         }
         self._lock = threading.Lock()
     
@@ -85,9 +86,26 @@ class TaskQueue:
         with self._lock:
             for priority in TaskPriority:
                 if self._queues[priority]:
-                    return self._queues[priority].pop(0)
+                    return self._queues[priority].popleft()
         return None
     
+    def get_batch(self, max_count: int) -> list[WorkerTask]:
+        """Get up to max_count tasks in priority order with one lock acquisition
+        
+        Args:
+            max_count: Maximum number of tasks to take
+            
+        Returns:
+            Tasks in the order get() would have returned them
+        """
+        tasks: list[WorkerTask] = []
+        with self._lock:
+            for priority in TaskPriority:
+                pending = self._queues[priority]
+                while pending and len(tasks) < max_count:
+                    tasks.append(pending.popleft())
+        return tasks
+    
     def peek(self) -> Optional[WorkerTask]:
         """Peek at highest priority task without removing"""
         with self._lock:
@@ -148,6 +166,7 @@ class WorkerPool:
         # Workers
         self.workers: dict[str, Worker] = {}
         self._worker_counter = 0
+        self._processes = WorkerProcesses()
         
         # Task queue
         self.task_queue = TaskQueue()
@@ -256,10 +275,9 @@ class WorkerPool:
             if remaining_time > 0:
                 time.sleep(min(remaining_time, 2.0))
             
-            with self._lock:
-                for worker in self.workers.values():
-                    if worker.process and worker.process.poll() is None:
-                        self._kill_process_tree(worker.process)
+            for _, process in self._processes.items():
+                if process.poll() is None:
+                    self._kill_process_tree(process)
     
     def _cleanup_worker_process(self, worker: Worker, wait: bool = True, timeout: float = 10.0) -> None:
         """Clean up a single worker process
@@ -269,31 +287,26 @@ class WorkerPool:
             wait: Wait for process to terminate
             timeout: Maximum wait time
         """
-        if worker.process is None:
+        # Popping clears the process reference whatever happens below
+        process = self._processes.pop(worker.id)
+        if process is None:
             return
         
         try:
             # Try graceful termination first
-            if worker.process.poll() is None:
-                worker.process.terminate()
+            if process.poll() is None:
+                process.terminate()
                 
                 if wait:
                     try:
-                        worker.process.wait(timeout=timeout / 2)
+                        process.wait(timeout=timeout / 2)
                     except subprocess.TimeoutExpired:
                         # Force kill if terminate didn't work
-                        self._kill_process_tree(worker.process)
+                        self._kill_process_tree(process)
                         
         except (OSError, subprocess.SubprocessError) as e:
             # Process may already be dead
             pass
-        finally:
-            # Ensure process reference is cleared
-            try:
-                if worker.process:
-                    worker.process = None
-            except Exception:
-                pass
     
     def _kill_process_tree(self, process: subprocess.Popen) -> None:
         """Kill a process and all its children
@@ -339,9 +352,9 @@ class WorkerPool:
             
             worker = Worker(
                 id=worker_id,
-                state=WorkerState.IDLE,
-                last_heartbeat=datetime.now(timezone.utc).isoformat()
+                state=WorkerState.IDLE
             )
+            worker.update_heartbeat()
             
             self.workers[worker_id] = worker
             return worker
@@ -426,16 +439,23 @@ class WorkerPool:
             else:
                 worker = idle_workers[0]
             
-            # Assign task
-            worker.current_task = task
-            worker.state = WorkerState.BUSY
-            worker.progress = 0
-            worker.started_at = datetime.now(timezone.utc).isoformat()
-            worker.update_heartbeat()
-            worker.worktree_path = task.worktree_path
-            
+            self._start_task(worker, task)
             return worker
     
+    def _start_task(self, worker: Worker, task: WorkerTask) -> None:
+        """Mark a worker busy with a task (caller holds _lock)
+        
+        Args:
+            worker: Idle worker
+            task: Task to run
+        """
+        worker.current_task = task
+        worker.state = WorkerState.BUSY
+        worker.progress = 0
+        worker.started_at = time.time_ns()
+        worker.update_heartbeat()
+        worker.worktree_path = task.worktree_path
+    
     def submit_task(
         self,
         task: WorkerTask,
@@ -512,32 +532,26 @@ class WorkerPool:
             List of timed out workers
         """
         timed_out = []
-        now = datetime.now(timezone.utc)
+        now_mono = time.monotonic_ns()
+        now_ns = time.time_ns()
         timeout_seconds = self.config.pheromone.timeout
         
         with self._lock:
             for worker in self.workers.values():
-                if not worker.last_heartbeat:
+                elapsed = worker.heartbeat_age(now_mono, now_ns)
+                if elapsed is None:
                     continue
                 
-                try:
-                    hb_time = datetime.fromisoformat(
-                        worker.last_heartbeat.replace('Z', '+00:00')
-                    )
-                    elapsed = (now - hb_time).total_seconds()
+                if elapsed > timeout_seconds and worker.state == WorkerState.BUSY:
+                    worker.state = WorkerState.TIMEOUT
+                    timed_out.append(worker)
                     
-                    if elapsed > timeout_seconds and worker.state == WorkerState.BUSY:
-                        worker.state = WorkerState.TIMEOUT
-                        timed_out.append(worker)
-                        
-                        # Callback
-                        if self._on_worker_error:
-                            error = TimeoutError(
-                                f"Worker {worker.id} heartbeat timeout"
-                            )
-                            self._on_worker_error(worker.id, error)
-                except (ValueError, TypeError):
-                    continue
+                    # Callback
+                    if self._on_worker_error:
+                        error = TimeoutError(
+                            f"Worker {worker.id} heartbeat timeout"
+                        )
+                        self._on_worker_error(worker.id, error)
         
         return timed_out
     
@@ -574,29 +588,22 @@ class WorkerPool:
     def task_stealing(self) -> int:
         """Perform task stealing for load balancing
         
-        Moves tasks from overloaded workers to idle workers.
+        Moves tasks from overloaded workers to idle workers. One batch of
+        pending tasks, one per idle worker, is taken from the queue at once.
         
         Returns:
             Number of tasks reassigned
         """
-        reassigned = 0
-        
         with self._lock:
             idle_workers = self.get_idle_workers()
             if not idle_workers:
                 return 0
             
-            # Check for pending tasks
-            while self.task_queue.size() > 0 and idle_workers:
-                task = self.task_queue.get()
-                if task:
-                    worker = idle_workers.pop(0)
-                    self.assign_cell(task)
-                    reassigned += 1
-                else:
-                    break
+            tasks = self.task_queue.get_batch(len(idle_workers))
+            for worker, task in zip(idle_workers, tasks):
+                self._start_task(worker, task)
         
-        return reassigned
+        return len(tasks)
     
     def get_load_balance(self) -> dict[str, Any]:
         """Get load balance statistics
@@ -605,8 +612,12 @@ class WorkerPool:
             Load balance statistics
         """
         with self._lock:
-            idle = len(self.get_idle_workers())
-            busy = len(self.get_busy_workers())
+            idle = busy = 0
+            for w in self.workers.values():
+                if w.is_idle():
+                    idle += 1
+                elif w.is_busy():
+                    busy += 1
             pending = self.task_queue.size()
             
             return {
@@ -627,17 +638,24 @@ class WorkerPool:
             Pool statistics
         """
         with self._lock:
+            # Single pass over workers for every per-state count and total
+            by_state: dict[WorkerState, int] = {}
+            completed = failed = 0
+            for w in self.workers.values():
+                state = w.state
+                by_state[state] = by_state.get(state, 0) + 1
+                completed += w.completed_tasks
+                failed += w.failed_tasks
+
             stats = PoolStats(
                 total_workers=len(self.workers),
-                idle_workers=len(self.get_idle_workers()),
-                busy_workers=len(self.get_busy_workers()),
-                blocked_workers=sum(1 for w in self.workers.values() 
-                                   if w.state == WorkerState.BLOCKED),
-                error_workers=sum(1 for w in self.workers.values() 
-                                 if w.state == WorkerState.ERROR),
+                idle_workers=by_state.get(WorkerState.IDLE, 0),
+                busy_workers=by_state.get(WorkerState.BUSY, 0),
+                blocked_workers=by_state.get(WorkerState.BLOCKED, 0),
+                error_workers=by_state.get(WorkerState.ERROR, 0),
                 pending_tasks=self.task_queue.size(),
-                completed_tasks=sum(w.completed_tasks for w in self.workers.values()),
-                failed_tasks=sum(w.failed_tasks for w in self.workers.values())
+                completed_tasks=completed,
+                failed_tasks=failed
             )
         
         return stats
@@ -670,7 +688,7 @@ class WorkerPool:
                     "progress": w.progress,
                     "completed_tasks": w.completed_tasks,
                     "failed_tasks": w.failed_tasks,
-                    "last_heartbeat": w.last_heartbeat
+                    "last_heartbeat": ns_to_iso(w.last_heartbeat)
                 }
                 for w_id, w in self.workers.items()
             }
@@ -26,10 +26,23 @@ import json
 import os
 import sys
 import time
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+# orjson is optional (faster pheromone file encode/decode)
+try:
+    import orjson
+
+    def _dumps(data: Dict) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(data: Dict) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+    _loads = json.loads
+
 # Cross-platform file locking
 HAS_FCNTL = False
 HAS_MSVCRT = False
@@ -45,6 +58,16 @@ except ImportError:
         pass
 
 
+def _utc_now_iso() -> str:
+    """Format the current UTC time like datetime.isoformat(), without datetime"""
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    gm = time.gmtime(sec)
+    return (
+        f"{gm.tm_year:04d}-{gm.tm_mon:02d}-{gm.tm_mday:02d}T"
+        f"{gm.tm_hour:02d}:{gm.tm_min:02d}:{gm.tm_sec:02d}.{ns // 1000:06d}+00:00"
+    )
+
+
 class FileLock:
     """Cross-platform file lock for concurrent access protection"""
 
@@ -152,9 +175,8 @@ class FileLock:
                 # Clean up lock file for advisory locking mode
                 if not (HAS_FCNTL or HAS_MSVCRT):
                     try:
-                        if self.lock_file.exists():
-                            self.lock_file.unlink()
-                    except (IOError, OSError):
+                        os.unlink(self.lock_file)
+                    except OSError:
                         pass
 
     def __enter__(self):
@@ -175,6 +197,8 @@ class HiveCoordinator:
         self.pheromone_file = self.hive_root / "pheromone.json"
         self.lock_file = self.hive_root / ".pheromone.lock"
         self.cells_dir = self.hive_root / "cells"
+        # (st_ino, st_mtime_ns, st_size) and parsed data of the last read
+        self._cache = None
 
     def _find_hive_root(self) -> Path:
         """查找蜂巢根目录"""
@@ -187,12 +211,22 @@ class HiveCoordinator:
         return Path.cwd() / ".trellis"
 
     def _read_pheromone(self) -> Dict:
-        """读取信息素文件"""
-        if not self.pheromone_file.exists():
+        """读取信息素文件
+
+        Parsed data is cached against the file's inode, mtime and size, so
+        repeated reads in one hook run parse the file once. The returned
+        dict is shared; callers that modify it must write it back.
+        """
+        try:
+            st = os.stat(self.pheromone_file)
+        except FileNotFoundError:
             return {"status": "inactive"}
 
-        with open(self.pheromone_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if self._cache is None or self._cache[0] != key:
+            with open(self.pheromone_file, 'rb') as f:
+                self._cache = (key, _loads(f.read()))
+        return self._cache[1]
 
     def _write_pheromone_atomic(self, data: Dict):
         """写入信息素文件（原子操作）"""
@@ -201,15 +235,16 @@ class HiveCoordinator:
         # Write to temp file first, then atomic replace
         temp_file = self.pheromone_file.with_suffix('.tmp')
         try:
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            temp_file.write_bytes(_dumps(data))
             temp_file.replace(self.pheromone_file)
-        finally:
-            if temp_file.exists():
-                temp_file.unlink(missing_ok=True)
+        except BaseException:
+            # After a successful replace() the temp file is gone; only clean up on failure
+            temp_file.unlink(missing_ok=True)
+            raise
 
     def _write_pheromone(self, data: Dict):
         """写入信息素文件（带锁保护）"""
+        self._cache = None
         with FileLock(self.lock_file):
             self._write_pheromone_atomic(data)
 
@@ -221,9 +256,10 @@ class HiveCoordinator:
     def get_current_cell(self) -> Optional[str]:
         """获取当前巢室ID"""
         current_task_file = self.hive_root / ".current-task"
-        if current_task_file.exists():
+        try:
             return current_task_file.read_text().strip()
-        return None
+        except FileNotFoundError:
+            return None
 
     def get_worker_id(self) -> str:
         """获取当前工蜂ID"""
@@ -291,21 +327,21 @@ class PreToolUseHandler:
         """加载巢室上下文"""
         context_file = self.coordinator.cells_dir / cell_id / "context.jsonl"
 
-        if not context_file.exists():
-            return []
-
         contexts = []
-        with open(context_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.strip():
-                    contexts.append(json.loads(line))
+        try:
+            with open(context_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        contexts.append(json.loads(line))
+        except FileNotFoundError:
+            return []
 
         return contexts
 
     def _update_worker_status(self, pheromone: Dict, worker_id: str,
                               cell_id: str, subagent_type: str):
         """更新工蜂状态"""
-        now = datetime.now(timezone.utc).isoformat()
+        now = _utc_now_iso()
 
         # 查找或创建工蜂记录
         workers = pheromone.get("workers", [])
@@ -427,7 +463,7 @@ class SubagentStopHandler:
     def _mark_completion(self, worker_id: str, cell_id: str, subagent_type: str):
         """标记完成"""
         pheromone = self.coordinator._read_pheromone()
-        now = datetime.now(timezone.utc).isoformat()
+        now = _utc_now_iso()
 
         # 更新工蜂状态
         for worker in pheromone.get("workers", []):
@@ -18,7 +18,7 @@ import threading
 import time
 import importlib.util
 from pathlib import Path
-from unittest import TestCase, main
+from unittest import TestCase, main, skipUnless
 from unittest.mock import Mock, patch, MagicMock
 
 # Resolve paths
@@ -51,15 +51,21 @@ _load_module_from_path("hive.models", _hive_path / "models.py")
 _load_module_from_path("hive.cell_dag", _hive_path / "cell_dag.py")
 _load_module_from_path("hive.worker_pool", _hive_path / "worker_pool.py")
 _load_module_from_path("hive.pheromone", _hive_path / "pheromone.py")
+_load_module_from_path("hive.queen_scheduler", _hive_path / "queen_scheduler.py")
+_load_module_from_path("hive.drone_validator", _hive_path / "drone_validator.py")
 
 # Now import from loaded modules
-from hive.models import Worker, WorkerState, WorkerTask, TaskPriority, HiveError
+from hive.models import Worker, WorkerState, WorkerTask, TaskPriority, HiveError, ns_to_iso
 from hive.cell_dag import CellDAG, CellNode, CellState, CycleDetectedError
 from hive.worker_pool import WorkerPool
 from hive.pheromone import (
     PheromoneManager, EnhancedPheromoneManager, PheromoneType, 
     PheromoneEntry, PheromoneSubscriber
 )
+from hive.hive_config import HiveConfig, HAS_YAML
+from hive.cell_manager import validate_cell_id, ValidationError
+from hive.drone_validator import DroneValidator, ValidationError as DroneValidationError
+from hive.queen_scheduler import QueenScheduler
 
 
 class TestModels(TestCase):
@@ -93,7 +99,37 @@ class TestModels(TestCase):
         self.assertEqual(task.description, "Test task")
         self.assertEqual(task.priority, TaskPriority.HIGH)
         self.assertEqual(task.timeout, 300)  # default
-    
+
+    def test_worker_task_to_dict_tracks_changes(self):
+        """Test WorkerTask.to_dict reflects fields changed after a call"""
+        import dataclasses
+        task = WorkerTask(cell_id="cell-1", description="before")
+        self.assertEqual(task.to_dict()["description"], "before")
+
+        task.description = "after"
+        task.timeout = 60
+        d = task.to_dict()
+        self.assertEqual((d["description"], d["timeout"]), ("after", 60))
+        self.assertEqual(
+            set(d), {f.name for f in dataclasses.fields(WorkerTask)}
+        )
+
+    def test_worker_task_heap_order(self):
+        """Test WorkerTask orders by priority and is hashable"""
+        import heapq
+
+        low = WorkerTask(cell_id="low", priority=TaskPriority.LOW)
+        high = WorkerTask(cell_id="high", priority=TaskPriority.HIGH)
+        medium = WorkerTask(cell_id="medium", priority=TaskPriority.MEDIUM)
+
+        heap: list = []
+        for task in (low, high, medium):
+            heapq.heappush(heap, task)
+
+        self.assertEqual(heapq.heappop(heap).cell_id, "high")
+        self.assertEqual(heapq.heappop(heap).cell_id, "medium")
+        self.assertEqual(len({low, high, medium}), 3)
+
     def test_worker_creation(self):
         """Test Worker dataclass creation"""
         worker = Worker(id="worker-1")
@@ -169,6 +205,29 @@ class TestModels(TestCase):
         worker.update_heartbeat()
         
         self.assertIsNotNone(worker.last_heartbeat)
+
+    def test_worker_heartbeat_age(self):
+        """Test heartbeat age ignores wall-clock jumps"""
+        worker = Worker(id="worker-1")
+        self.assertIsNone(worker.heartbeat_age())
+
+        worker.update_heartbeat()
+        # A wall clock set an hour ahead must not fake a timeout
+        age = worker.heartbeat_age(now_ns=worker.last_heartbeat + 3600 * 10**9)
+        self.assertLess(age, 60)
+
+        # A directly assigned heartbeat falls back to the wall clock
+        worker.last_heartbeat -= 120 * 10**9
+        self.assertGreaterEqual(worker.heartbeat_age(), 120)
+
+    def test_worker_tick_all(self):
+        """Test batch heartbeat update shares one timestamp"""
+        workers = [Worker(id=f"worker-{i}") for i in range(3)]
+
+        Worker.tick_all(workers)
+
+        self.assertIsNotNone(workers[0].last_heartbeat)
+        self.assertEqual(len({w.last_heartbeat for w in workers}), 1)
     
     def test_worker_to_dict(self):
         """Test Worker serialization"""
@@ -180,7 +239,38 @@ class TestModels(TestCase):
         self.assertEqual(data["state"], "busy")
         self.assertIn("completed_tasks", data)
         self.assertNotIn("process", data)  # process should be excluded
-    
+
+    def test_worker_to_dict_with_task(self):
+        """Test Worker serialization includes a JSON-ready task"""
+        worker = Worker(id="worker-1")
+        worker.assign_task(WorkerTask(cell_id="cell-1", priority=TaskPriority.HIGH))
+
+        data = worker.to_dict()
+
+        self.assertEqual(data["current_task"]["cell_id"], "cell-1")
+        self.assertEqual(data["current_task"]["priority"], 1)
+        self.assertIsInstance(data["current_task"]["created_at"], str)
+        json.dumps(data)
+
+    def test_worker_to_dict_reflects_direct_updates(self):
+        """Test cached Worker serialization tracks direct field writes"""
+        worker = Worker(id="worker-1")
+        self.assertEqual(worker.to_dict()["progress"], 0)
+
+        worker.progress = 50
+        worker.state = WorkerState.BLOCKED
+
+        data = worker.to_dict()
+        self.assertEqual(data["progress"], 50)
+        self.assertEqual(data["state"], "blocked")
+
+    def test_worker_to_json(self):
+        """Test Worker JSON encoding matches to_dict"""
+        worker = Worker(id="worker-1")
+        worker.assign_task(WorkerTask(cell_id="cell-1"))
+
+        self.assertEqual(json.loads(worker.to_json()), worker.to_dict())
+
     def test_hive_error_base_class(self):
         """Test HiveError can be raised and caught"""
         with self.assertRaises(HiveError):
@@ -426,6 +516,24 @@ class TestWorkerPool(TestCase):
         # Should get highest priority first
         first = self.pool.task_queue.get()
         self.assertEqual(first.cell_id, "cell-1")
+
+    def test_task_stealing_assigns_batch(self):
+        """Test queued tasks are handed to every idle worker in one pass"""
+        self.pool.start()
+        while len(self.pool.workers) < self.pool.max_workers:
+            self.pool._spawn_worker()
+
+        for i, priority in enumerate(
+            (TaskPriority.LOW, TaskPriority.HIGH, TaskPriority.MEDIUM, TaskPriority.LOW)
+        ):
+            self.pool.task_queue.put(WorkerTask(cell_id=f"cell-{i}", priority=priority))
+
+        self.assertEqual(self.pool.task_stealing(), 3)
+        self.assertEqual(
+            sorted(w.current_task.cell_id for w in self.pool.get_busy_workers()),
+            ["cell-0", "cell-1", "cell-2"]
+        )
+        self.assertEqual(self.pool.task_queue.get().cell_id, "cell-3")
     
     def test_get_stats(self):
         """Test getting pool statistics"""
@@ -441,6 +549,154 @@ class TestWorkerPool(TestCase):
         self.assertGreaterEqual(stats.idle_workers, 0)
 
 
+class TestCellManager(TestCase):
+    """Tests for cell_manager validation"""
+    
+    def test_validate_cell_id(self):
+        """Test cell IDs accepted and rejected by validate_cell_id"""
+        for cell_id in ("c1", "cell-auth", "Cell_2", "9", "a" * 64):
+            validate_cell_id(cell_id)
+        
+        for cell_id in (
+            "", "-cell", "_cell", "cell auth", "cell/../x", "cell.json",
+            "a" * 65, "célula", "c1\n", "c1\r\n",
+        ):
+            with self.assertRaises(ValidationError, msg=repr(cell_id)):
+                validate_cell_id(cell_id)
+
+
+class TestDroneValidator(TestCase):
+    """Tests for DroneValidator"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.hive_root = Path(self.temp_dir) / ".trellis"
+        self.hive_root.mkdir(parents=True)
+        self.validator = DroneValidator(hive_root=self.hive_root, seed=1)
+    
+    def tearDown(self):
+        """Clean up after tests"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_validate_cell_id(self):
+        """Test drone cell ID checks match cell_manager's"""
+        for cell_id in ("c1", "cell-auth", "Cell_2", "a" * 64):
+            self.validator._validate_cell_id(cell_id)
+        
+        for cell_id in ("", "-cell", "cell auth", "cell/../x", "a" * 65, "c1\n"):
+            with self.assertRaises(DroneValidationError, msg=repr(cell_id)):
+                self.validator._validate_cell_id(cell_id)
+            with self.assertRaises(ValidationError, msg=repr(cell_id)):
+                validate_cell_id(cell_id)
+    
+    def test_cross_validate_score_variance(self):
+        """Test the one-pass score variance matches statistics.pvariance"""
+        import statistics
+        
+        for scores in (
+            [90, 90, 90], [100] * 5, [80, 95, 100], [0, 100],
+            [99, 98, 97, 96, 95], [73],
+        ):
+            results = iter(
+                {"consensus_score": score, "consensus_reached": score >= 90}
+                for score in scores
+            )
+            with patch.object(
+                DroneValidator, "validate_cell",
+                side_effect=lambda *args, **kwargs: next(results)
+            ):
+                report = self.validator.cross_validate(
+                    "c1", num_drones=len(scores), seeds=list(range(len(scores)))
+                )
+            
+            self.assertEqual(
+                report["score_variance"], int(statistics.pvariance(scores)),
+                msg=repr(scores)
+            )
+            self.assertEqual(report["average_score"], int(statistics.mean(scores)))
+
+
+class TestHiveConfig(TestCase):
+    """Tests for HiveConfig"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        """Clean up after tests"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    @skipUnless(HAS_YAML, "PyYAML not installed")
+    def test_save_load_round_trip(self):
+        """Test a saved config loads back with the same values"""
+        import yaml
+        config_path = Path(self.temp_dir) / "hive-config.yaml"
+        config = HiveConfig()
+        config.save(config_path)
+        
+        loaded = HiveConfig.load(config_path)
+        self.assertEqual(loaded.to_dict(), config.to_dict())
+        self.assertIsInstance(yaml.safe_load(config_path.read_text(encoding="utf-8")), dict)
+        
+        # Config representers stay off PyYAML's shared dumpers
+        shared = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        self.assertNotIn(HiveConfig, shared.yaml_representers)
+
+
+class TestQueenScheduler(TestCase):
+    """Tests for QueenScheduler"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.hive_root = Path(self.temp_dir) / ".trellis"
+        self.hive_root.mkdir(parents=True)
+        self.pm = PheromoneManager(self.hive_root)
+        with patch(
+            "hive.queen_scheduler.get_pheromone_manager", return_value=self.pm
+        ):
+            self.queen = QueenScheduler(
+                hive_root=self.hive_root, config=HiveConfig(), max_workers=1
+            )
+        self.queen.cell_manager = Mock()
+        self.queen._initialize_workers()
+    
+    def tearDown(self):
+        """Clean up after tests"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_assign_syncs_complete_worker(self):
+        """Test a sync woken by assignment sees the fully updated worker"""
+        queen = self.queen
+        worker = queen.workers["worker-1"]
+        # Last heartbeat from long before the worker went idle
+        worker.last_heartbeat = time.time_ns() - 3600 * 10**9
+        worker.progress = 50
+        
+        # Run the heartbeat loop's work at the moment it would wake
+        set_state = queen._set_worker_state
+        def set_state_and_sync(w, state):
+            set_state(w, state)
+            queen._check_worker_heartbeats()
+            queen.coordinate_pheromone_sync()
+        
+        with patch.object(queen, "_set_worker_state", side_effect=set_state_and_sync):
+            self.assertTrue(queen.assign_cell_to_worker(worker, {"id": "c1"}))
+        queen.coordinate_pheromone_sync()
+        
+        self.assertEqual(worker.state, WorkerState.BUSY)
+        synced = self.pm._read_pheromone()["workers"][0]
+        self.assertEqual(synced["state"], "busy")
+        self.assertEqual(synced["cell_id"], "c1")
+        self.assertEqual(synced["progress"], 0)
+        self.assertEqual(synced["last_heartbeat"], ns_to_iso(worker.last_heartbeat))
+
+
 class TestEnhancedPheromoneManager(TestCase):
     """Tests for EnhancedPheromoneManager"""
     
@@ -454,6 +710,7 @@ class TestEnhancedPheromoneManager(TestCase):
     def tearDown(self):
         """Clean up after tests"""
         import shutil
+        self.pm.close()
         shutil.rmtree(self.temp_dir, ignore_errors=True)
     
     def test_emit_pheromone(self):
@@ -465,9 +722,56 @@ class TestEnhancedPheromoneManager(TestCase):
         )
         
         self.assertEqual(entry.type, PheromoneType.PROGRESS)
+        self.assertEqual(entry.type_str, "progress")
         self.assertEqual(entry.source, "worker-1")
         self.assertEqual(entry.data["progress"], 50)
     
+    def test_get_active_trails(self):
+        """Test active trails split out blockers and return copies"""
+        self.pm.update_worker_status("worker-1", "cell-1", "busy")
+        self.pm.emit(PheromoneType.PROGRESS, source="worker-1", data={})
+        self.pm.emit_blocker("cell-1", "waiting on API", source="worker-1")
+        
+        trails = self.pm.get_active_trails()
+        self.assertEqual(len(trails["active_pheromones"]), 2)
+        self.assertEqual(len(trails["blockers"]), 1)
+        self.assertEqual(trails["blockers"][0]["target"], "cell-1")
+        
+        trails["workers"][0]["status"] = "mutated"
+        trails["active_pheromones"].clear()
+        fresh = self.pm.get_active_trails()
+        self.assertEqual(fresh["workers"][0]["status"], "busy")
+        self.assertEqual(len(fresh["active_pheromones"]), 2)
+    
+    def test_active_pheromones_capped(self):
+        """Test active pheromones keep only the most recent entries"""
+        self.pm._max_active_pheromones = 3
+        for i in range(5):
+            self.pm.emit(PheromoneType.PROGRESS, source=f"worker-{i}", data={})
+        
+        active = self.pm._read_pheromone()["active_pheromones"]
+        self.assertEqual([p["source"] for p in active], ["worker-2", "worker-3", "worker-4"])
+    
+    def test_active_pheromones_cap_keeps_blockers(self):
+        """Test the cap drops expired, then non-blocker entries, not blockers"""
+        self.pm._max_active_pheromones = 3
+        self.pm.write_pheromone({"active_pheromones": [{
+            "type": "progress", "source": "stale",
+            "timestamp_epoch": time.time() - 1000, "ttl": 300
+        }]})
+        self.pm.emit_blocker("c1", "waiting", "worker-0")
+        for i in range(1, 6):
+            self.pm.emit(PheromoneType.PROGRESS, source=f"worker-{i}", data={})
+        
+        active = self.pm._read_pheromone()["active_pheromones"]
+        self.assertEqual(
+            [p["source"] for p in active], ["worker-0", "worker-4", "worker-5"]
+        )
+        self.assertEqual([b["target"] for b in self.pm.get_active_blockers()], ["c1"])
+        
+        self.pm.resolve_blocker("c1", "queen")
+        self.assertEqual(self.pm.get_active_blockers(), [])
+    
     def test_emit_blocker(self):
         """Test emitting a blocker pheromone"""
         entry = self.pm.emit_blocker(
@@ -495,6 +799,22 @@ class TestEnhancedPheromoneManager(TestCase):
         self.assertEqual(received[0].type, PheromoneType.PROGRESS)
         
         self.pm.unsubscribe(subscriber)
+
+        self.pm.emit(PheromoneType.PROGRESS, "worker-1", {})
+        self.assertEqual(len(received), 1)
+
+    def test_notifier_delivers_off_emit_path(self):
+        """Test callbacks run on the notifier thread when it is started"""
+        threads = []
+        self.pm.subscribe(lambda entry: threads.append(threading.current_thread()))
+
+        self.pm.start_notifier()
+        for i in range(3):
+            self.pm.emit(PheromoneType.PROGRESS, f"worker-{i}", {})
+        self.pm.stop_notifier()
+
+        self.assertEqual(len(threads), 3)
+        self.assertNotIn(threading.current_thread(), threads)
     
     def test_decay_pheromones(self):
         """Test pheromone decay"""
@@ -512,7 +832,61 @@ class TestEnhancedPheromoneManager(TestCase):
         expired = self.pm.decay_pheromones()
         
         self.assertGreater(expired, 0)
-    
+
+    def test_decay_monitor_wakes_for_expiry(self):
+        """Test the decay monitor expires entries ahead of its interval"""
+        with patch("hive.pheromone.DECAY_MIN_INTERVAL", 0.05):
+            self.pm.start_decay_monitor(interval=60)
+            try:
+                # Monitor is idle; the emit wakes it to schedule the expiry
+                self.pm.emit(PheromoneType.PROGRESS, "worker-1", {}, ttl=0.2)
+                deadline = time.monotonic() + 5
+                while (self.pm._read_pheromone().get("active_pheromones")
+                       and time.monotonic() < deadline):
+                    time.sleep(0.05)
+            finally:
+                self.pm.stop_decay_monitor()
+
+        self.assertEqual(self.pm._read_pheromone()["active_pheromones"], [])
+        self.assertIsNone(self.pm._next_expiry)
+
+    def test_decay_skips_unchanged_write(self):
+        """Test a decay pass that changes nothing does not rewrite the file"""
+        self.pm.emit(
+            pheromone_type=PheromoneType.PROGRESS,
+            source="worker-1",
+            data={},
+            ttl=3600
+        )
+
+        with patch.object(self.pm, "write_pheromone") as write:
+            expired = self.pm.decay_pheromones()
+
+        self.assertEqual(expired, 0)
+        write.assert_not_called()
+
+    def test_decay_uses_epoch_timestamps(self):
+        """Test decay ages entries by epoch and still handles legacy entries"""
+        entry = self.pm.emit(
+            pheromone_type=PheromoneType.PROGRESS,
+            source="worker-1",
+            data={},
+            ttl=60
+        )
+        self.assertAlmostEqual(entry.timestamp_epoch, time.time(), delta=5)
+
+        data = self.pm._read_pheromone()
+        data["active_pheromones"][0]["timestamp_epoch"] -= 120
+        data["active_pheromones"].append({
+            "type": "progress",
+            "source": "legacy",
+            "timestamp": "2000-01-01T00:00:00+00:00",
+            "ttl": 60
+        })
+        self.pm.write_pheromone(data)
+
+        self.assertEqual(self.pm.decay_pheromones(), 2)
+
     def test_resolve_blocker(self):
         """Test resolving a blocker"""
         self.pm.emit_blocker("cell-1", "test", "worker-1")
@@ -527,7 +901,24 @@ class TestEnhancedPheromoneManager(TestCase):
         # Check blocker removed
         blockers = self.pm.get_active_blockers()
         self.assertEqual(len(blockers), 0)
-    
+
+    def test_resolve_blocker_leaves_other_cells(self):
+        """Test resolving one cell keeps other blockers in order"""
+        for cell_id in ("cell-1", "cell-2", "cell-3"):
+            self.pm.emit_blocker(cell_id, "test", "worker-1")
+
+        self.pm.resolve_blocker("cell-2", "worker-1")
+
+        self.assertEqual(
+            [b["target"] for b in self.pm.get_active_blockers()],
+            ["cell-1", "cell-3"]
+        )
+
+        # A cell without blockers only records the completion pheromone
+        with patch.object(self.pm, "write_pheromone", wraps=self.pm.write_pheromone) as write:
+            self.pm.resolve_blocker("cell-9", "worker-1")
+        self.assertEqual(write.call_count, 1)
+
     def test_history(self):
         """Test pheromone history"""
         for i in range(5):
@@ -540,7 +931,104 @@ class TestEnhancedPheromoneManager(TestCase):
         history = self.pm.get_history()
         
         self.assertGreaterEqual(len(history), 5)
-    
+
+    def test_history_bounded(self):
+        """Test history evicts oldest entries and returns newest first-to-last"""
+        self.pm._max_history = 3
+        self.pm.clear_history()
+
+        for i in range(5):
+            self.pm.emit(
+                pheromone_type=PheromoneType.PROGRESS,
+                source=f"worker-{i}",
+                data={}
+            )
+
+        self.assertEqual(
+            [e.source for e in self.pm.get_history()],
+            ["worker-2", "worker-3", "worker-4"]
+        )
+        self.assertEqual(
+            [e.source for e in self.pm.get_history(limit=2)],
+            ["worker-3", "worker-4"]
+        )
+        self.assertEqual(self.pm.get_history(cell_id="worker-1"), [])
+        self.assertEqual(
+            [e.source for e in self.pm.get_history(
+                cell_id="worker-3", pheromone_type=PheromoneType.PROGRESS
+            )],
+            ["worker-3"]
+        )
+        self.assertEqual(
+            self.pm.get_history(cell_id="worker-3", pheromone_type=PheromoneType.ALERT),
+            []
+        )
+        self.assertEqual(set(self.pm._history_by_cell), {"worker-2", "worker-3", "worker-4"})
+
+    def test_coalesced_emits_written_once(self):
+        """Test entries emitted while coalescing share one write"""
+        with patch.object(
+            self.pm, "_write_pheromone_atomic",
+            wraps=self.pm._write_pheromone_atomic
+        ) as write:
+            self.pm.start_update_coalescer(window=0.5)
+            for i in range(3):
+                self.pm.emit(
+                    pheromone_type=PheromoneType.PROGRESS,
+                    source=f"worker-{i}",
+                    data={}
+                )
+            self.pm.update_worker_status("worker-0", "cell-1", "busy")
+            self.pm.stop_update_coalescer()
+
+        self.assertEqual(write.call_count, 1)
+        data = self.pm._read_pheromone()
+        self.assertEqual(
+            [p["source"] for p in data["active_pheromones"]],
+            ["worker-0", "worker-1", "worker-2"]
+        )
+        self.assertEqual(data["workers"][0]["id"], "worker-0")
+
+    def test_hold_lock_writes_bypass_coalescer(self):
+        """Test writes inside hold_lock() are not queued for the coalescer"""
+        self.pm.start_update_coalescer(window=0.5)
+        try:
+            with self.pm.hold_lock():
+                self.pm.update_worker_status("worker-1", "cell-1", "busy")
+                self.pm.emit(
+                    pheromone_type=PheromoneType.PROGRESS,
+                    source="worker-1",
+                    data={}
+                )
+                data = self.pm._read_pheromone()
+            self.assertEqual(data["workers"][0]["id"], "worker-1")
+            self.assertEqual(len(data["active_pheromones"]), 1)
+            self.assertFalse(self.pm._pending_updates)
+            self.assertFalse(self.pm._pending_entries)
+        finally:
+            self.pm.stop_update_coalescer()
+
+    def test_resolve_blocker_while_coalescing(self):
+        """Test queued blockers are seen and resolved while coalescing"""
+        self.pm.start_update_coalescer(window=0.5)
+        try:
+            self.pm.emit_blocker("c1", "waiting", "worker-1")
+            self.assertEqual(
+                [b["target"] for b in self.pm.get_active_blockers()], ["c1"]
+            )
+
+            self.pm.emit_blocker("c2", "waiting", "worker-2")
+            self.pm.resolve_blocker("c2", "queen")
+            self.assertEqual(
+                [b["target"] for b in self.pm.get_active_blockers()], ["c1"]
+            )
+        finally:
+            self.pm.stop_update_coalescer()
+
+        self.assertEqual(
+            [b["target"] for b in self.pm.get_active_blockers()], ["c1"]
+        )
+
     def test_worktree_registration(self):
         """Test worktree registration for propagation"""
         worktree_path = Path(self.temp_dir) / "worktree"
@@ -554,6 +1042,267 @@ class TestEnhancedPheromoneManager(TestCase):
         
         self.assertNotIn("wt-1", self.pm._worktrees)
 
+    def test_broadcast_propagates_to_worktree(self):
+        """Test broadcasts are appended to each worktree as JSON lines"""
+        worktree_paths = [Path(self.temp_dir) / f"worktree-{i}" for i in range(3)]
+        for i, path in enumerate(worktree_paths):
+            self.pm.register_worktree(f"wt-{i}", path)
+
+        for i in range(2):
+            self.pm.emit(
+                pheromone_type=PheromoneType.ALERT,
+                source=f"worker-{i}",
+                data={"note": "发现"}
+            )
+
+        for path in worktree_paths:
+            incoming = path / ".trellis" / "incoming_pheromones.jsonl"
+            lines = incoming.read_text(encoding="utf-8").splitlines()
+            self.assertEqual(len(lines), 2)
+            self.assertEqual(json.loads(lines[1])["source"], "worker-1")
+            self.assertEqual(json.loads(lines[0])["data"], {"note": "发现"})
+
+        # Worktrees receive the same record that went into the pheromone file
+        active = self.pm._read_pheromone()["active_pheromones"]
+        self.assertEqual([json.loads(line) for line in lines], active)
+
+        for i in range(3):
+            self.pm.unregister_worktree(f"wt-{i}")
+        self.assertEqual(self.pm._worktree_fds, {})
+
+        # close() shuts down the propagation pool and its threads
+        pool = self.pm._propagate_pool
+        self.assertIsNotNone(pool)
+        self.pm.close()
+        self.assertIsNone(self.pm._propagate_pool)
+        self.assertTrue(all(not t.is_alive() for t in pool._threads))
+
+    def test_broadcast_follows_recreated_worktree(self):
+        """Test a worktree removed and recreated at one path keeps receiving"""
+        import shutil
+        worktree_path = Path(self.temp_dir) / "worktree"
+        incoming = worktree_path / ".trellis" / "incoming_pheromones.jsonl"
+        self.pm.register_worktree("wt-1", worktree_path)
+
+        self.pm.emit(pheromone_type=PheromoneType.ALERT, source="worker-1", data={})
+        shutil.rmtree(worktree_path)
+        self.pm.emit(pheromone_type=PheromoneType.ALERT, source="worker-2", data={})
+
+        lines = incoming.read_text(encoding="utf-8").splitlines()
+        self.assertEqual([json.loads(line)["source"] for line in lines], ["worker-2"])
+
+        # close() releases the cached descriptors
+        self.pm.close()
+        self.assertEqual(self.pm._worktree_fds, {})
+
+    def test_lock_waits_for_release(self):
+        """Test a contended lock is acquired soon after release"""
+        from hive.pheromone import FileLock
+
+        holder = FileLock(self.pm.lock_file)
+        self.assertTrue(holder.acquire())
+        waiter = FileLock(self.pm.lock_file)
+        self.assertFalse(waiter.acquire(timeout=0.05))
+
+        threading.Timer(0.05, holder.release).start()
+        start = time.monotonic()
+        self.assertTrue(waiter.acquire(timeout=5.0))
+        waiter.release()
+        self.assertLess(time.monotonic() - start, 1.0)
+
+    def test_lock_excludes_threads(self):
+        """Test threads holding separate FileLocks on one path never overlap"""
+        from hive.pheromone import FileLock
+
+        inside = []
+        overlaps = []
+
+        def work():
+            for _ in range(20):
+                with FileLock(self.pm.lock_file):
+                    inside.append(1)
+                    if len(inside) > 1:
+                        overlaps.append(1)
+                    inside.pop()
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(overlaps, [])
+
+    @skipUnless(os.name == "posix", "flock probe is Unix-only")
+    def test_long_held_lock_not_cleaned_up(self):
+        """Test a held lock with an old holder record is not unlinked"""
+        from hive.pheromone import FileLock, LockInfo
+
+        with self.pm.hold_lock():
+            holder = self.pm._local.held
+            # Make the holder record look older than the stale threshold
+            old = time.time() - 1000
+            holder._info_time = old
+            self.pm.lock_file.write_bytes(f"{os.getpid()}:{old}:host".encode())
+            inode = self.pm.lock_file.stat().st_ino
+
+            FileLock(self.pm.lock_file)._cleanup_stale_lock()
+            self.assertEqual(self.pm.lock_file.stat().st_ino, inode)
+
+            # Writes inside the hold refresh the record
+            self.pm.write_pheromone({"status": "active"})
+            info = LockInfo.from_file(self.pm.lock_file)
+            self.assertFalse(info.is_stale())
+
+    def test_read_cache_sees_other_writers(self):
+        """Test cached reads pick up writes from another manager"""
+        other = PheromoneManager(self.hive_root)
+
+        self.pm.write_pheromone({"status": "active", "workers": []})
+        self.assertTrue(other.is_hive_active())
+
+        self.pm.write_pheromone({"status": "inactive", "workers": []})
+        self.assertFalse(other.is_hive_active())
+
+    def test_update_worker_status_updates_in_place(self):
+        """Test repeated worker updates modify the existing entry"""
+        self.pm.update_worker_status("worker-1", "cell-1", "busy", progress=10)
+        self.pm.update_worker_status("worker-2", "cell-2", "busy")
+        self.pm.update_worker_status("worker-1", "cell-1", "idle", progress=100)
+
+        workers = self.pm._read_pheromone()["workers"]
+        self.assertEqual([w["id"] for w in workers], ["worker-1", "worker-2"])
+        self.assertEqual(workers[0]["status"], "idle")
+        self.assertEqual(workers[0]["progress"], 100)
+
+    def test_write_recreates_removed_hive_root(self):
+        """Test writes still work after the hive directory is removed"""
+        import shutil
+
+        self.pm.update_worker_status("worker-1", "cell-1", "busy")
+        shutil.rmtree(self.hive_root)
+
+        self.pm.update_worker_status("worker-2", "cell-2", "busy")
+
+        workers = self.pm._read_pheromone()["workers"]
+        self.assertEqual([w["id"] for w in workers], ["worker-2"])
+
+    def test_read_large_file(self):
+        """Test reads above the memory-map threshold parse the same data"""
+        from hive import pheromone
+
+        self.pm.update_worker_status("worker-1", "cell-1", "busy")
+        reader = PheromoneManager(self.hive_root)
+        with patch.object(pheromone, "MMAP_READ_THRESHOLD", 1):
+            data = reader._read_pheromone()
+
+        self.assertEqual(data["workers"][0]["id"], "worker-1")
+
+    def test_read_returns_private_copy(self):
+        """Test mutating read results does not leak into later reads"""
+        self.pm.update_worker_status("worker-1", "cell-1", "busy")
+
+        data = self.pm._read_pheromone()
+        data["workers"][0]["status"] = "mutated"
+        data["workers"].append({"id": "worker-2"})
+
+        fresh = self.pm._read_pheromone()
+        self.assertEqual(len(fresh["workers"]), 1)
+        self.assertEqual(fresh["workers"][0]["status"], "busy")
+
+    def test_utc_now_iso_format(self):
+        """Test fast timestamp matches the datetime ISO format"""
+        from datetime import datetime, timezone
+        from hive.pheromone import _utc_now_iso
+
+        ts = _utc_now_iso()
+        parsed = datetime.fromisoformat(ts)
+
+        self.assertEqual(parsed.tzinfo, timezone.utc)
+        self.assertEqual(parsed.isoformat(timespec="microseconds"), ts)
+        self.assertLess(abs((datetime.now(timezone.utc) - parsed).total_seconds()), 5)
+
+        # The cached date/time prefix must follow second boundaries
+        for now_ns in (1_700_000_000_999_999_000, 1_700_000_001_000_001_000, 86_400_000_000_000):
+            expected = datetime.fromtimestamp(now_ns // 1000 / 1e6, timezone.utc)
+            self.assertEqual(
+                _utc_now_iso(now_ns),
+                expected.isoformat(timespec="microseconds")
+            )
+
+    def test_iso_to_epoch(self):
+        """Test timestamp parsing fast path and fallbacks agree"""
+        from datetime import datetime
+        from hive.pheromone import _iso_to_epoch
+
+        for ts in (
+            "2025-03-04T05:06:07.123456+00:00",
+            "2025-03-04T05:06:07+00:00",
+            "2025-03-04T05:06:07.123456Z",
+            "2025-03-04T07:06:07.123456+02:00",
+        ):
+            expected = datetime.fromisoformat(ts.replace("Z", "+00:00")).timestamp()
+            self.assertAlmostEqual(_iso_to_epoch(ts), expected, places=5)
+
+        with self.assertRaises(ValueError):
+            _iso_to_epoch("2025-03-04T05:06:07")
+
+    def test_batch_writes_once(self):
+        """Test batched updates are flushed in a single write"""
+        with patch.object(
+            self.pm, "_write_pheromone_atomic",
+            wraps=self.pm._write_pheromone_atomic
+        ) as write:
+            with self.pm.batch():
+                for i in range(3):
+                    self.pm.update_worker_status(f"worker-{i}", f"cell-{i}", "busy")
+                self.pm.update_worker_status("worker-0", "cell-0", "idle")
+
+        self.assertEqual(write.call_count, 1)
+        workers = self.pm._read_pheromone()["workers"]
+        self.assertEqual(len(workers), 3)
+        self.assertEqual(workers[0]["status"], "idle")
+
+    def test_hold_lock_reuses_lock(self):
+        """Test writes under hold_lock do not take the lock again"""
+        from hive import pheromone
+
+        with self.pm.hold_lock():
+            with patch.object(pheromone, "FileLock") as lock_cls:
+                self.pm.update_worker_status("worker-1", "cell-1", "busy")
+                with self.pm.batch():
+                    self.pm.update_worker_status("worker-2", "cell-2", "busy")
+            lock_cls.assert_not_called()
+
+        workers = self.pm._read_pheromone()["workers"]
+        self.assertEqual([w["id"] for w in workers], ["worker-1", "worker-2"])
+
+    def test_update_coalescer_merges_updates(self):
+        """Test coalesced worker updates are written together"""
+        with patch.object(
+            self.pm, "_write_pheromone_atomic",
+            wraps=self.pm._write_pheromone_atomic
+        ) as write:
+            self.pm.start_update_coalescer(window=0.5)
+            for progress in (10, 50, 90):
+                self.pm.update_worker_status("worker-1", "cell-1", "busy", progress)
+            self.pm.update_worker_status("worker-2", "cell-2", "busy")
+            self.pm.stop_update_coalescer()
+
+        self.assertEqual(write.call_count, 1)
+        workers = self.pm._read_pheromone()["workers"]
+        self.assertEqual([w["id"] for w in workers], ["worker-1", "worker-2"])
+        self.assertEqual(workers[0]["progress"], 90)
+
+    def test_batch_discards_on_error(self):
+        """Test a failing batch leaves the file unchanged"""
+        with self.assertRaises(RuntimeError):
+            with self.pm.batch():
+                self.pm.update_worker_status("worker-1", "cell-1", "busy")
+                raise RuntimeError("boom")
+
+        self.assertEqual(self.pm._read_pheromone().get("workers", []), [])
+
 
 class TestPheromoneSubscriber(TestCase):
     """Tests for PheromoneSubscriber"""